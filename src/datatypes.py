@@ -1,12 +1,20 @@
 import operator
+import time
+from array import array
+from collections import deque
 from concurrent.futures import Future as PyFuture
 from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from fractions import Fraction
-from queue import Queue as PyQueue
+from itertools import repeat
+from threading import Condition, Event, Lock, RLock
 
 from .errors import MError, RTError, TError
 from .utils import RTResult
 
+LIST_VIEW_MIN = 64
+BYTES_VIEW_MIN = 4096
+
 
 class ThreadPoolError(Exception):
     def __init__(self, err):
@@ -14,6 +22,37 @@ class ThreadPoolError(Exception):
         super().__init__(err)
 
 
+class IterError(Exception):
+    def __init__(self, message):
+        self.message = message
+        super().__init__(message)
+
+
+class CancelToken:
+    __slots__ = ("event", "deadline", "parent")
+
+    def __init__(self, parent=None, timeout=None):
+        self.event = Event()
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.parent = parent
+
+    def cancel(self):
+        self.event.set()
+
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def reason(self):
+        token = self
+        while token is not None:
+            if token.event.is_set():
+                return "Task was cancelled"
+            if token.expired():
+                return "Task exceeded its deadline"
+            token = token.parent
+        return None
+
+
 class Context:
 
     __slots__ = (
@@ -169,11 +208,117 @@ class Object:
 
 
 class Channel(Object):
-    __slots__ = ("queue",)
+    __slots__ = (
+        "items",
+        "capacity",
+        "closed",
+        "lock",
+        "not_empty",
+        "not_full",
+        "waiters",
+    )
 
-    def __init__(self, queue_instance=None):
+    def __init__(self, capacity=0):
         super().__init__()
-        self.queue = queue_instance if queue_instance else PyQueue()
+        self.items = deque()
+        self.capacity = capacity
+        self.closed = False
+        self.lock = Lock()
+        self.not_empty = Condition(self.lock)
+        self.not_full = Condition(self.lock)
+        self.waiters = set()
+
+    def _notify_waiters(self):
+        self.not_empty.notify()
+        for event in self.waiters:
+            event.set()
+
+    def send(self, value, timeout=None):
+        with self.not_full:
+            if self.capacity > 0:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while len(self.items) >= self.capacity and not self.closed:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        return "timeout"
+                    self.not_full.wait(remaining)
+            if self.closed:
+                return "closed"
+            self.items.append(value)
+            self._notify_waiters()
+            return "ok"
+
+    def recv(self, timeout=None):
+        with self.not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self.items:
+                if self.closed:
+                    return "closed", None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return "timeout", None
+                self.not_empty.wait(remaining)
+            value = self.items.popleft()
+            self.not_full.notify()
+            return "ok", value
+
+    def send_many(self, values, timeout=None):
+        with self.not_full:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            i = 0
+            while i < len(values):
+                if self.closed:
+                    return "closed", i
+                if self.capacity > 0:
+                    space = self.capacity - len(self.items)
+                    if space <= 0:
+                        remaining = (
+                            None if deadline is None else deadline - time.monotonic()
+                        )
+                        if remaining is not None and remaining <= 0:
+                            return "timeout", i
+                        self.not_full.wait(remaining)
+                        continue
+                    batch = values[i : i + space]
+                else:
+                    batch = values[i:]
+                self.items.extend(batch)
+                i += len(batch)
+                self.not_empty.notify_all()
+                for event in self.waiters:
+                    event.set()
+            return "ok", i
+
+    def recv_many(self, max_items=0, timeout=None):
+        with self.not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not self.items:
+                if self.closed:
+                    return "closed", []
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return "timeout", []
+                self.not_empty.wait(remaining)
+            if max_items <= 0 or max_items >= len(self.items):
+                values = list(self.items)
+                self.items.clear()
+            else:
+                values = [self.items.popleft() for _ in range(max_items)]
+            self.not_full.notify_all()
+            return "ok", values
+
+    def close(self):
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
+            for event in self.waiters:
+                event.set()
+
+    def empty(self):
+        return not self.items
 
     def copy(self):
         return self
@@ -182,18 +327,130 @@ class Channel(Object):
         return "<channel>"
 
     def __repr__(self):
-        return f"<channel size={self.queue.qsize()}>"
+        state = " closed" if self.closed else ""
+        if self.capacity > 0:
+            return f"<channel size={len(self.items)} capacity={self.capacity}{state}>"
+        return f"<channel size={len(self.items)}{state}>"
+
+
+# The lock-free path is only safe under the GIL: it relies on single
+# deque.append/extend/popleft calls being atomic, and on exactly one
+# thread sending and one thread receiving. Without the GIL (free-threaded
+# builds), use Channel instead.
+class SPSCChannel(Channel):
+    __slots__ = ("ready", "waiting")
+
+    def __init__(self):
+        super().__init__()
+        self.ready = Event()
+        self.waiting = False
+
+    def _wake(self):
+        if self.waiting:
+            self.ready.set()
+        for event in tuple(self.waiters):
+            event.set()
+
+    def send(self, value, timeout=None):
+        if self.closed:
+            return "closed"
+        self.items.append(value)
+        self._wake()
+        return "ok"
+
+    def send_many(self, values, timeout=None):
+        if self.closed:
+            return "closed", 0
+        self.items.extend(values)
+        self._wake()
+        return "ok", len(values)
+
+    def _wait(self, deadline):
+        self.waiting = True
+        self.ready.clear()
+        try:
+            if self.items or self.closed:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self.ready.wait(remaining)
+            return True
+        finally:
+            self.waiting = False
+
+    def recv(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return "ok", self.items.popleft()
+            except IndexError:
+                if self.closed and not self.items:
+                    return "closed", None
+            if not self._wait(deadline):
+                return "timeout", None
+
+    def recv_many(self, max_items=0, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.items:
+            if self.closed:
+                return "closed", []
+            if not self._wait(deadline):
+                return "timeout", []
+        count = len(self.items)
+        if max_items > 0:
+            count = min(count, max_items)
+        popleft = self.items.popleft
+        return "ok", [popleft() for _ in range(count)]
+
+    def close(self):
+        self.closed = True
+        self.ready.set()
+        self._wake()
+
+    def __repr__(self):
+        state = " closed" if self.closed else ""
+        return f"<channel spsc size={len(self.items)}{state}>"
+
+
+def select_channels(channels, timeout=None):
+    event = Event()
+    for ch in channels:
+        with ch.lock:
+            ch.waiters.add(event)
+    try:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            event.clear()
+            all_closed = True
+            for i, ch in enumerate(channels):
+                status, value = ch.recv(0)
+                if status == "ok":
+                    return i, value
+                if status != "closed":
+                    all_closed = False
+            if all_closed:
+                return -1, None
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return -1, None
+            event.wait(remaining)
+    finally:
+        for ch in channels:
+            with ch.lock:
+                ch.waiters.discard(event)
 
 
 class ThreadWrapper(Object):
-    __slots__ = "thread"
+    __slots__ = ("thread", "token")
 
-    def __init__(self, thread):
+    def __init__(self, thread, token=None):
         super().__init__()
         self.thread = thread
+        self.token = token
 
     def copy(self):
-        copy = ThreadWrapper(self.thread)
+        copy = ThreadWrapper(self.thread, self.token)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
@@ -214,8 +471,8 @@ class ThreadWrapper(Object):
         return self.thread.is_alive()
 
     def cancel(self):
-        if self.thread.is_alive():
-            self.thread._stop()
+        if self.token is not None:
+            self.token.cancel()
 
     def type(self):
         return "<thread>"
@@ -247,6 +504,12 @@ class NoneObject(Object):
     def type(self):
         return "<none>"
 
+    def __eq__(self, other):
+        return isinstance(other, NoneObject)
+
+    def __hash__(self):
+        return hash(None)
+
     def get_comparison_eq(self, other):
         if isinstance(other, NoneObject):
             return Number.true.set_context(self.context), None
@@ -271,7 +534,26 @@ class NoneObject(Object):
         return Bool(self.value or other.value).set_context(self.context), None
 
 
-NoneObject.none = NoneObject("none")
+class SharedNoneObject(NoneObject):
+    __slots__ = ()
+
+    def __init__(self, value):
+        super().__init__(value)
+        Object.set_pos(self)
+        Object.set_context(self)
+
+    def set_pos(self, pos_start=None, pos_end=None):
+        if pos_start is None and pos_end is None:
+            return self
+        return NoneObject(self.value).set_pos(pos_start, pos_end)
+
+    def set_context(self, context=None):
+        if context is None:
+            return self
+        return NoneObject(self.value).set_context(context)
+
+
+NoneObject.none = SharedNoneObject("none")
 
 
 class Bool(Object):
@@ -336,9 +618,34 @@ class Bool(Object):
     def __repr__(self):
         return str(self.value).lower()
 
+    def __eq__(self, other):
+        return isinstance(other, Bool) and self.value == other.value
+
+    def __hash__(self):
+        return hash((Bool, self.value))
 
-Bool.true = Bool(True)
-Bool.false = Bool(False)
+
+class SharedBool(Bool):
+    __slots__ = ()
+
+    def __init__(self, value):
+        super().__init__(value)
+        Object.set_pos(self)
+        Object.set_context(self)
+
+    def set_pos(self, pos_start=None, pos_end=None):
+        if pos_start is None and pos_end is None:
+            return self
+        return Bool(self.value).set_pos(pos_start, pos_end)
+
+    def set_context(self, context=None):
+        if context is None:
+            return self
+        return Bool(self.value).set_context(context)
+
+
+Bool.true = SharedBool(True)
+Bool.false = SharedBool(False)
 
 
 class CFloat(Object):
@@ -521,6 +828,12 @@ class CFloat(Object):
     def type(self):
         return "<cfloat>"
 
+    def __eq__(self, other):
+        return isinstance(other, (Number, CFloat)) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __str__(self):
         return self.__repr__()
 
@@ -560,6 +873,8 @@ class Number(Object):
         other_value = self._convert_value(other)
         if other_value is not None:
             return Number(self.value + other_value).set_context(self.context), None
+        if isinstance(other, Array):
+            return other.reflected(operator.add, self)
         return None, Object.illegal_operation(
             other, f"Can't add number to '{other.type()}'"
         )
@@ -568,6 +883,8 @@ class Number(Object):
         other_value = self._convert_value(other)
         if other_value is not None:
             return Number(self.value - other_value).set_context(self.context), None
+        if isinstance(other, Array):
+            return other.reflected(operator.sub, self)
         return None, Object.illegal_operation(
             other, f"Can't subtract number from '{other.type()}'"
         )
@@ -576,6 +893,8 @@ class Number(Object):
         other_value = self._convert_value(other)
         if other_value is not None:
             return Number(self.value * other_value).set_context(self.context), None
+        if isinstance(other, Array):
+            return other.reflected(operator.mul, self)
         return None, Object.illegal_operation(
             other, f"Can't multiply number by '{other.type()}'"
         )
@@ -588,6 +907,8 @@ class Number(Object):
                     other.pos_start, other.pos_end, "Division by zero", self.context
                 )
             return Number(self.value / other_value).set_context(self.context), None
+        if isinstance(other, Array):
+            return other.reflected(operator.truediv, self)
         return None, Object.illegal_operation(
             other, f"Can't divide number by '{other.type()}'"
         )
@@ -722,6 +1043,12 @@ class Number(Object):
         elif isinstance(self, NoneObject):
             return "<none>"
 
+    def __eq__(self, other):
+        return isinstance(other, (Number, CFloat)) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __str__(self):
         return self.__repr__()
 
@@ -796,6 +1123,12 @@ class String(Object):
     def type(self):
         return "<str>"
 
+    def __eq__(self, other):
+        return isinstance(other, String) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
     def __str__(self):
         return self.value
 
@@ -847,23 +1180,38 @@ class PyObject(Object):
 
 class List(Object):
 
-    __slots__ = "value"
+    __slots__ = ("value", "shared", "owned")
 
     def __init__(self, value):
         super().__init__()
         self.value = value
+        self.shared = False
+        self.owned = False
+
+    def size(self):
+        return len(self.value)
+
+    def detach(self):
+        self.value = self.value[:]
+        self.shared = False
+
+    def sliced(self, start, stop, step):
+        source = self.value
+        window = range(len(source))[start:stop:step]
+        if len(window) < LIST_VIEW_MIN or 4 * len(window) < len(source):
+            return List(source[start:stop:step])
+        self.shared = True
+        return ListSlice(source, window)
 
     def added_to(self, other):
-        new_list = self.copy()
-        new_list.value.append(other)
-        return new_list, None
+        return List(self.value + [other]).set_context(self.context), None
 
     def subbed_by(self, other):
         if isinstance(other, Number):
-            new_list = self.copy()
+            values = self.value[:]
             try:
-                new_list.value.pop(other.value)
-                return new_list, None
+                values.pop(other.value)
+                return List(values).set_context(self.context), None
             except:
                 return None, RTError(
                     other.pos_start,
@@ -878,13 +1226,9 @@ class List(Object):
 
     def multed_by(self, other):
         if isinstance(other, List):
-            new_list = self.copy()
-            new_list.value.extend(other.value)
-            return new_list, None
+            return List(self.value + other.value).set_context(self.context), None
         elif isinstance(other, Number):
-            new_list = self.copy()
-            new_list.value = self.value * other.value
-            return new_list, None
+            return List(self.value * other.value).set_context(self.context), None
         else:
             return None, self.illegal_operation(
                 other, f"Can't multiply list by '{other.type()}'"
@@ -905,28 +1249,19 @@ class List(Object):
             return None, self.illegal_operation(other, "Index must be a number")
 
     def copy(self):
-        copy = List(self.value[:])
+        self.shared = True
+        copy = List(self.value)
+        copy.shared = True
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
 
     def get_comparison_eq(self, other):
-        if not isinstance(other, List):
-            return Number.false.set_context(self.context), None
-        if len(self.value) != len(other.value):
-            return Number.false.set_context(self.context), None
-
-        for i in range(len(self.value)):
-            cmp, err = self.value[i].get_comparison_eq(other.value[i])
-            if err:
-                return None, err
-            if not cmp.is_true():
-                return Number.false.set_context(self.context), None
-        return Number.true.set_context(self.context), None
+        return Bool(self == other).set_context(self.context), None
 
     def get_comparison_ne(self, other):
         eq_result, _ = self.get_comparison_eq(other)
-        if eq_result == Number.true:
+        if eq_result is not None and eq_result.is_true():
             return Number.false.set_context(self.context), None
         return Number.true.set_context(self.context), None
 
@@ -936,6 +1271,12 @@ class List(Object):
     def type(self):
         return "<list>"
 
+    def __eq__(self, other):
+        return isinstance(other, List) and self.value == other.value
+
+    def __hash__(self):
+        return hash(tuple(self.value))
+
     def iter(self):
         return iter(self.value), None
 
@@ -946,11 +1287,88 @@ class List(Object):
         return str(self.value)
 
 
+class ListSlice(List):
+    __slots__ = ("source", "window", "data")
+
+    def __init__(self, source, window):
+        Object.__init__(self)
+        self.source = source
+        self.window = window
+        self.data = None
+        self.shared = True
+        self.owned = False
+
+    def _items(self):
+        window = self.window
+        if window.step == 1:
+            return self.source[window.start : window.stop]
+        return list(map(self.source.__getitem__, window))
+
+    @property
+    def value(self):
+        if self.data is None:
+            self.data = self._items()
+            self.source = None
+            self.shared = False
+        return self.data
+
+    @value.setter
+    def value(self, value):
+        self.data = value
+        self.source = None
+
+    def size(self):
+        if self.data is None:
+            return len(self.window)
+        return len(self.data)
+
+    def detach(self):
+        if self.data is None:
+            self.value
+        else:
+            List.detach(self)
+
+    def sliced(self, start, stop, step):
+        if self.data is not None:
+            return List.sliced(self, start, stop, step)
+        window = self.window[start:stop:step]
+        if len(window) < LIST_VIEW_MIN:
+            return List(list(map(self.source.__getitem__, window)))
+        return ListSlice(self.source, window)
+
+    def dollared_by(self, other):
+        if self.data is not None or not isinstance(other, Number):
+            return List.dollared_by(self, other)
+        try:
+            return self.source[self.window[other.value]], None
+        except IndexError:
+            return None, RTError(
+                other.pos_start,
+                other.pos_end,
+                f"Index {other.value} is out of bounds for list of size {len(self.window)}",
+                self.context,
+            )
+
+    def iter(self):
+        if self.data is None:
+            return map(self.source.__getitem__, self.window), None
+        return iter(self.data), None
+
+    def copy(self):
+        if self.data is not None:
+            return List.copy(self)
+        copy = ListSlice(self.source, self.window)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+
 class HashMap(Object):
-    __slots__ = "value"
+    __slots__ = ("value", "owned")
 
     def __init__(self, value):
         super().__init__()
+        self.owned = False
         self.value: dict[str, Object] = {}
         if isinstance(value, HashMap):
             raw = value.value
@@ -979,6 +1397,12 @@ class HashMap(Object):
     def type(self):
         return "<hashmap>"
 
+    def __eq__(self, other):
+        return isinstance(other, HashMap) and self.value == other.value
+
+    def __hash__(self):
+        return hash(frozenset(self.value.items()))
+
     def dollared_by(self, index):
         if not isinstance(index, String):
             return None, self.illegal_operation(index)
@@ -1018,24 +1442,11 @@ class HashMap(Object):
         return iter(pairs), None
 
     def get_comparison_eq(self, other):
-        if not isinstance(other, HashMap):
-            return Number.false.set_context(self.context), None
-        if len(self.value) != len(other.value):
-            return Number.false.set_context(self.context), None
-
-        for key, value in self.value.items():
-            if key not in other.value:
-                return Number.false.set_context(self.context), None
-            cmp, err = value.get_comparison_eq(other.value[key])
-            if err:
-                return None, err
-            if not cmp.is_true():
-                return Number.false.set_context(self.context), None
-        return Number.true.set_context(self.context), None
+        return Bool(self == other).set_context(self.context), None
 
     def get_comparison_ne(self, other):
         eq_result, _ = self.get_comparison_eq(other)
-        if eq_result == Number.true:
+        if eq_result is not None and eq_result.is_true():
             return Number.false.set_context(self.context), None
         return Number.true.set_context(self.context), None
 
@@ -1055,14 +1466,282 @@ class HashMap(Object):
         return str(self.value)
 
 
+def frozen_key(value):
+    if isinstance(value, List):
+        return (List, tuple(map(frozen_key, value.value)))
+    if isinstance(value, HashMap):
+        return (
+            HashMap,
+            frozenset((key, frozen_key(item)) for key, item in value.value.items()),
+        )
+    if isinstance(value, Set):
+        return (Set, frozenset(value.value))
+    if isinstance(value, Bytes):
+        return bytes(value.value)
+    return value
+
+
+def thawed(key):
+    kind = type(key)
+    if kind is tuple:
+        container, items = key
+        if container is List:
+            return List(list(map(thawed, items)))
+        if container is HashMap:
+            return HashMap({name: thawed(item) for name, item in items})
+        return Set(dict.fromkeys(items))
+    if kind is bytes:
+        return Bytes(key)
+    return key
+
+
+class Set(Object):
+    __slots__ = ("value", "shared")
+
+    def __init__(self, value=None):
+        super().__init__()
+        self.value = value if value is not None else {}
+        self.shared = False
+
+    def detach(self):
+        self.value = self.value.copy()
+        self.shared = False
+
+    def add(self, value):
+        if self.shared:
+            self.detach()
+        self.value[frozen_key(value)] = None
+
+    def update(self, values):
+        if self.shared:
+            self.detach()
+        self.value.update(dict.fromkeys(map(frozen_key, values)))
+
+    def remove(self, value):
+        key = frozen_key(value)
+        if key not in self.value:
+            return False
+        if self.shared:
+            self.detach()
+        del self.value[key]
+        return True
+
+    def contains(self, value):
+        return frozen_key(value) in self.value
+
+    def items(self):
+        return list(map(thawed, self.value))
+
+    def union(self, other):
+        result = self.value.copy()
+        result.update(other.value)
+        return Set(result)
+
+    def intersection(self, other):
+        small, large = self.value, other.value
+        if len(large) < len(small):
+            small, large = large, small
+        return Set({item: None for item in small if item in large})
+
+    def difference(self, other):
+        exclude = other.value
+        return Set({item: None for item in self.value if item not in exclude})
+
+    def is_true(self):
+        return len(self.value) > 0
+
+    def iter(self):
+        return iter(self.items()), None
+
+    def get_comparison_eq(self, other):
+        return Bool(self == other).set_context(self.context), None
+
+    def get_comparison_ne(self, other):
+        return Bool(self != other).set_context(self.context), None
+
+    def copy(self):
+        self.shared = True
+        copy = Set(self.value)
+        copy.shared = True
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def type(self):
+        return "<set>"
+
+    def __eq__(self, other):
+        return isinstance(other, Set) and self.value.keys() == other.value.keys()
+
+    def __hash__(self):
+        return hash(frozenset(self.value))
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        if not self.value:
+            return "set()"
+        return "{" + ", ".join(map(repr, self.items())) + "}"
+
+
+class Array(Object):
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def dtype(self):
+        return "int" if self.value.typecode == "q" else "float"
+
+    def _operand(self, other):
+        if isinstance(other, Array):
+            if len(other.value) != len(self.value):
+                return None, RTError(
+                    other.pos_start,
+                    other.pos_end,
+                    f"Array sizes do not match ({len(self.value)} and {len(other.value)})",
+                    self.context,
+                )
+            return other.value, None
+        if isinstance(other, Number) and not isinstance(other, NoneObject):
+            return repeat(other.value, len(self.value)), None
+        if isinstance(other, CFloat):
+            return repeat(float(other.value), len(self.value)), None
+        return None, Object.illegal_operation(
+            other, f"Can't combine array with '{other.type()}'"
+        )
+
+    def _result_code(self, other, op):
+        if op is operator.truediv or self.value.typecode == "d":
+            return "d"
+        if isinstance(other, Array):
+            return other.value.typecode
+        return "q" if isinstance(other, Number) and type(other.value) is int else "d"
+
+    def _elementwise(self, other, op, reflected=False):
+        values, error = self._operand(other)
+        if error:
+            return None, error
+        if op is operator.truediv:
+            if reflected:
+                divisor = self
+                zero = 0 in self.value
+            else:
+                divisor = other
+                zero = (
+                    0 in other.value if isinstance(other, Array) else other.value == 0
+                )
+            if zero:
+                return None, RTError(
+                    divisor.pos_start,
+                    divisor.pos_end,
+                    "Division by zero",
+                    self.context,
+                )
+        left, right = (values, self.value) if reflected else (self.value, values)
+        try:
+            result = array(self._result_code(other, op), map(op, left, right))
+        except OverflowError:
+            return None, MError(
+                self.pos_start,
+                self.pos_end,
+                "Integer overflow in array operation",
+                self.context,
+            )
+        return Array(result).set_context(self.context), None
+
+    def reflected(self, op, other):
+        return self._elementwise(other, op, True)
+
+    def added_to(self, other):
+        return self._elementwise(other, operator.add)
+
+    def subbed_by(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def multed_by(self, other):
+        return self._elementwise(other, operator.mul)
+
+    def dived_by(self, other):
+        return self._elementwise(other, operator.truediv)
+
+    def _mask(self, other, op):
+        values, error = self._operand(other)
+        if error:
+            return None, error
+        return (
+            Array(array("q", map(op, self.value, values))).set_context(self.context),
+            None,
+        )
+
+    def get_comparison_eq(self, other):
+        if isinstance(other, Array):
+            return Bool(self.value == other.value).set_context(self.context), None
+        return Number.false.set_context(self.context), None
+
+    def get_comparison_ne(self, other):
+        if isinstance(other, Array):
+            return Bool(self.value != other.value).set_context(self.context), None
+        return Number.true.set_context(self.context), None
+
+    def get_comparison_lt(self, other):
+        return self._mask(other, operator.lt)
+
+    def get_comparison_gt(self, other):
+        return self._mask(other, operator.gt)
+
+    def get_comparison_lte(self, other):
+        return self._mask(other, operator.le)
+
+    def get_comparison_gte(self, other):
+        return self._mask(other, operator.ge)
+
+    def dollared_by(self, index):
+        if not isinstance(index, Number):
+            return None, self.illegal_operation(index)
+        try:
+            return Number(self.value[int(index.value)]).set_context(self.context), None
+        except IndexError:
+            return None, RTError(
+                index.pos_start,
+                index.pos_end,
+                f"Index {index.value} is out of bounds for array of size {len(self.value)}",
+                self.context,
+            )
+
+    def iter(self):
+        return map(Number, self.value), None
+
+    def is_true(self):
+        return len(self.value) > 0
+
+    def copy(self):
+        copy = Array(self.value)
+        copy.set_pos(self.pos_start, self.pos_end)
+        copy.set_context(self.context)
+        return copy
+
+    def type(self):
+        return "<array>"
+
+    def __str__(self):
+        return self.__repr__()
+
+    def __repr__(self):
+        return f"array({self.value.tolist()}, {self.dtype()})"
+
+
 class File(Object):
 
-    __slots__ = ("name", "path")
+    __slots__ = ("name", "path", "handle")
 
-    def __init__(self, name, path):
+    def __init__(self, name, path, handle=None):
         super().__init__()
         self.name = name
         self.path = path
+        self.handle = handle
 
     def _make_comparison(self, other, op, type_to_check):
         if isinstance(other, type_to_check):
@@ -1077,8 +1756,61 @@ class File(Object):
     def get_comparison_ne(self, other):
         return self._make_comparison(other, operator.ne, File)
 
+    def is_binary(self):
+        return "b" in self.handle.mode
+
+    def wrap(self, data):
+        return Bytes(data) if isinstance(data, bytes) else String(data)
+
+    def read_chunk(self, size):
+        return self.wrap(self.handle.read(size))
+
+    def read_line(self):
+        line = self.handle.readline()
+        if not line:
+            return None
+        newline = b"\n" if isinstance(line, bytes) else "\n"
+        return self.wrap(line[:-1] if line.endswith(newline) else line)
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+
+    def iter(self):
+        if self.handle is None:
+            try:
+                handle = open(self.path, "r", encoding="utf-8")
+            except OSError as e:
+                return None, RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to open file "{self.path}": {e}',
+                    self.context,
+                )
+            return self.iter_lines(File(self.name, self.path, handle), True), None
+        if self.handle.closed:
+            return None, RTError(
+                self.pos_start,
+                self.pos_end,
+                "Cannot iterate over a closed file",
+                self.context,
+            )
+        return self.iter_lines(self, False), None
+
+    @staticmethod
+    def iter_lines(file, close_at_end):
+        try:
+            while True:
+                line = file.read_line()
+                if line is None:
+                    return
+                yield line
+        finally:
+            if close_at_end:
+                file.close()
+
     def copy(self):
-        copy = File(self.name, self.path)
+        copy = File(self.name, self.path, self.handle)
         copy.set_pos(self.pos_start, self.pos_end)
         copy.set_context(self.context)
         return copy
@@ -1087,9 +1819,84 @@ class File(Object):
         return "<file>"
 
     def __repr__(self):
+        if self.handle is not None:
+            state = "closed" if self.handle.closed else self.handle.mode
+            return f"<file {self.name} {state}>"
         return f"<file {self.name}>"
 
 
+class Iterator(Object):
+    __slots__ = ("value", "name")
+
+    def __init__(self, value, name="iterator"):
+        super().__init__()
+        self.value = value
+        self.name = name
+
+    def iter(self):
+        return self.value, None
+
+    def copy(self):
+        return self
+
+    def type(self):
+        return "<iterator>"
+
+    def __repr__(self):
+        return f"<iterator {self.name}>"
+
+
+class CSVWriter(Object):
+    __slots__ = ("path", "handle", "writer", "header")
+
+    def __init__(self, path, handle, writer, header=None):
+        super().__init__()
+        self.path = path
+        self.handle = handle
+        self.writer = writer
+        self.header = header
+
+    def close(self):
+        self.handle.close()
+
+    def copy(self):
+        return self
+
+    def type(self):
+        return "<csv-writer>"
+
+    def __repr__(self):
+        state = "closed" if self.handle.closed else "open"
+        return f"<csv-writer {self.path} {state}>"
+
+
+class StringBuilder(Object):
+    __slots__ = ("parts", "length")
+
+    def __init__(self, parts=None):
+        super().__init__()
+        self.parts = parts if parts is not None else []
+        self.length = sum(map(len, self.parts))
+
+    def append(self, text):
+        self.parts.append(text)
+        self.length += len(text)
+
+    def build(self):
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0] if self.parts else ""
+
+    def copy(self):
+        return self
+
+    def type(self):
+        return "<string-builder>"
+
+    def __repr__(self):
+        return f"<string-builder {self.length} chars>"
+
+
 class NameSpace(Object):
     __slots__ = ("name", "value", "_internal")
 
@@ -1103,6 +1910,7 @@ class NameSpace(Object):
             "context_": Number.none,
             "statements_": Number.none,
             "initialized_": Number.false,
+            "init_lock_": RLock(),
         }
 
     def get(self, name, checked=False):
@@ -1129,6 +1937,16 @@ class NameSpace(Object):
         copied_ns.set_context(self.context)
         return copied_ns
 
+    def __deepcopy__(self, memo):
+        copied_ns = NameSpace(self.name)
+        memo[id(self)] = copied_ns
+        for slot in ("fields", "pos_start", "pos_end", "context", "value"):
+            setattr(copied_ns, slot, deepcopy(getattr(self, slot), memo))
+        for key, value in self._internal.items():
+            if key != "init_lock_":
+                copied_ns._internal[key] = deepcopy(value, memo)
+        return copied_ns
+
     def type(self):
         return "<namespace>"
 
@@ -1145,7 +1963,10 @@ class Bytes(Object):
 
     def added_to(self, other):
         if isinstance(other, Bytes):
-            return Bytes(self.value + other.value).set_context(self.context), None
+            return (
+                Bytes(bytes(self.value) + bytes(other.value)).set_context(self.context),
+                None,
+            )
         return None, self.illegal_operation(other)
 
     def get_comparison_eq(self, other):
@@ -1187,6 +2008,15 @@ class Bytes(Object):
     def type(self):
         return "<bytes>"
 
+    def __eq__(self, other):
+        return isinstance(other, Bytes) and self.value == other.value
+
+    def __hash__(self):
+        try:
+            return hash(self.value)
+        except ValueError:
+            return hash(bytes(self.value))
+
     def __str__(self):
         return self.value.hex()
 
@@ -1195,11 +2025,73 @@ class Bytes(Object):
 
 
 class ThreadPool(Object):
-    __slots__ = ("executor",)
+    __slots__ = (
+        "executor",
+        "lock",
+        "queued",
+        "running",
+        "completed",
+        "failed",
+        "total_latency",
+    )
 
     def __init__(self, max_workers):
         super().__init__()
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.lock = Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_latency = 0.0
+
+    def submit(self, fn):
+        submitted = time.perf_counter()
+
+        def tracked():
+            with self.lock:
+                self.queued -= 1
+                self.running += 1
+            ok = False
+            try:
+                result = fn()
+                ok = True
+                return result
+            finally:
+                with self.lock:
+                    self.running -= 1
+                    self.completed += 1
+                    if not ok:
+                        self.failed += 1
+                    self.total_latency += time.perf_counter() - submitted
+
+        def discarded(future):
+            if future.cancelled():
+                with self.lock:
+                    self.queued -= 1
+
+        with self.lock:
+            self.queued += 1
+        try:
+            future = self.executor.submit(tracked)
+        except BaseException:
+            with self.lock:
+                self.queued -= 1
+            raise
+        future.add_done_callback(discarded)
+        return future
+
+    def stats(self):
+        with self.lock:
+            mean = self.total_latency / self.completed if self.completed else 0.0
+            return {
+                "max_workers": self.executor._max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "mean_latency": mean,
+            }
 
     def copy(self):
         return self
@@ -1212,11 +2104,20 @@ class ThreadPool(Object):
 
 
 class Future(Object):
-    __slots__ = ("future",)
+    __slots__ = ("future", "token")
 
-    def __init__(self, future: PyFuture):
+    def __init__(self, future: PyFuture, token=None):
         super().__init__()
         self.future = future
+        self.token = token
+
+    def cancel(self):
+        if self.future.cancel():
+            return True
+        if self.token is not None and not self.future.done():
+            self.token.cancel()
+            return True
+        return False
 
     def copy(self):
         return self
@@ -1226,3 +2127,25 @@ class Future(Object):
 
     def __repr__(self):
         return f"<future state={self.future._state}>"
+
+
+class Worker(Object):
+    __slots__ = ("process", "conn", "pending", "finished", "outcome")
+
+    def __init__(self, process, conn):
+        super().__init__()
+        self.process = process
+        self.conn = conn
+        self.pending = deque()
+        self.finished = False
+        self.outcome = None
+
+    def copy(self):
+        return self
+
+    def type(self):
+        return "<worker>"
+
+    def __repr__(self):
+        state = "alive" if self.process.is_alive() else "stopped"
+        return f"<worker pid={self.process.pid} {state}>"
@@ -59,6 +59,8 @@ class InvalidSyntaxError(Error):
 
 
 class RTError(Error):
+    kind = "RT"
+
     def __init__(self, pos_start, pos_end, details, context):
         super().__init__(pos_start, pos_end, "RuntimeError", details)
         self.context = context
@@ -93,18 +95,32 @@ class RTError(Error):
 
 
 class MError(RTError):
+    kind = "M"
+
     def __init__(self, pos_start, pos_end, details, context):
         super().__init__(pos_start, pos_end, details, context)
         self.error_name = "MathError"
 
 
 class IError(RTError):
+    kind = "IO"
+
     def __init__(self, pos_start, pos_end, details, context):
         super().__init__(pos_start, pos_end, details, context)
         self.error_name = "IOError"
 
 
 class TError(RTError):
+    kind = "T"
+
     def __init__(self, pos_start, pos_end, details, context):
         super().__init__(pos_start, pos_end, details, context)
         self.error_name = "TypeError"
+
+
+RUNTIME_ERRORS = {
+    "RuntimeError": RTError,
+    "MathError": MError,
+    "IOError": IError,
+    "TypeError": TError,
+}
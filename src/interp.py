@@ -1,13 +1,19 @@
+import asyncio
 import csv
 import hashlib
 import json
 import math
+import mmap
+import multiprocessing
+import operator
 import os
+import pickle
 import platform
 import random
 import re
 import socket
 import ssl
+import struct
 import subprocess
 import sys
 import time
@@ -15,18 +21,27 @@ import urllib.error
 import urllib.request
 import uuid
 import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED
+from concurrent.futures import CancelledError as FutureCancelledError
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as futures_wait
 from copy import deepcopy
 from datetime import date, datetime, timedelta
+from fractions import Fraction
 from getpass import getpass
+from itertools import accumulate, chain, compress, zip_longest
 from shutil import copy, rmtree
-from threading import Thread
+from threading import Lock, Thread, local
 from urllib.parse import unquote
 
 from colorama import Fore, Style, init
 
 from .consts import *
 from .datatypes import *
-from .errors import Error, IError, MError, RTError, TError
+from .errors import RUNTIME_ERRORS, Error, IError, MError, RTError, TError
 from .lexer import Lexer
 from .nodes import *
 from .parser import *
@@ -39,14 +54,65 @@ global_symbol_table = SymbolTable()
 
 
 module_cache = {}
+module_cache_lock = Lock()
+FILE_MODES = ("r", "rb", "w", "wb", "a", "ab")
+ARRAY_TYPECODES = {"int": "q", "float": "d"}
+ARRAY_REDUCE_OPS = ("sum", "min", "max", "mean")
+JSON_CHUNK_SIZE = 64 * 1024
+STRING_CLASSES = {
+    "digit": "0123456789",
+    "lower": "abcdefghijklmnopqrstuvwxyz",
+    "upper": "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "letter": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "space": " \t\n\r\v\f",
+}
+
+
+def parse_module_file(fn):
+    mtime = os.path.getmtime(fn)
+    with open(fn, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    text_lines = text.splitlines()
+    for i in range(len(text_lines)):
+        text_lines[i] = text_lines[i].strip()
+
+    lexer = Lexer(fn, "\n".join(text_lines))
+    tokens, error = lexer.make_tokens()
+    if error:
+        return None, error, mtime
+
+    parser = Parser(tokens)
+    ast = parser.parse()
+    return ast, ast.error, mtime
+
+
+def resolve_module_path(file_path):
+    if os.path.isfile(file_path):
+        return file_path
+    tmp_path = os.path.join(LIBS_PATH, file_path)
+    if os.path.isfile(tmp_path):
+        return tmp_path
+    return None
+
+
+def get_cached_module(fn):
+    with module_cache_lock:
+        return module_cache.get(fn)
+
+
+def set_cached_module(fn, ast, error, mtime):
+    with module_cache_lock:
+        module_cache[fn] = (ast, error, mtime)
 
 
 def load_module(fn, interpreter):
     ast = None
     mtime = os.path.getmtime(fn)
 
-    if fn in module_cache:
-        cached_ast, error, cached_mtime = module_cache[fn]
+    cached = get_cached_module(fn)
+    if cached is not None:
+        cached_ast, error, cached_mtime = cached
         if mtime == cached_mtime:
             if error:
                 return None, error
@@ -55,26 +121,12 @@ def load_module(fn, interpreter):
             ast = None
 
     if ast is None:
-        with open(fn, "r", encoding="utf-8") as f:
-            text = f.read()
+        ast, error, mtime = parse_module_file(fn)
+        set_cached_module(fn, ast, error, mtime)
 
-        text_lines = text.splitlines()
-        for i in range(len(text_lines)):
-            text_lines[i] = text_lines[i].strip()
-
-        lexer = Lexer(fn, "\n".join(text_lines))
-        tokens, error = lexer.make_tokens()
         if error:
             return None, error
 
-        parser = Parser(tokens)
-        ast = parser.parse()
-
-        module_cache[fn] = (ast, ast.error, mtime)
-
-        if ast.error:
-            return None, ast.error
-
     try:
         module_context = Context("<module>")
         module_context.symbol_table = global_symbol_table
@@ -98,6 +150,1037 @@ def load_module(fn, interpreter):
         sys.exit(2)
 
 
+parallel_executors = {}
+parallel_executors_lock = Lock()
+parallel_worker_cache = {}
+
+
+def collect_var_names(node, names):
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            collect_var_names(item, names)
+        return
+    if isinstance(node, VarAccessNode):
+        names.add(node.var_name_tok.value)
+        return
+    if type(node).__module__ != VarAccessNode.__module__:
+        return
+    slots = getattr(type(node), "__slots__", None)
+    if slots is None:
+        collect_var_names(list(vars(node).values()), names)
+        return
+    for slot in slots:
+        collect_var_names(getattr(node, slot, None), names)
+
+
+def encode_value(value, funcs):
+    if isinstance(value, Bool):
+        return bool(value.value)
+    if isinstance(value, NoneObject):
+        return None
+    if isinstance(value, (Number, CFloat, String)):
+        return value.value
+    if isinstance(value, Bytes):
+        return bytes(value.value)
+    if isinstance(value, List):
+        return [encode_value(v, funcs) for v in value.value]
+    if isinstance(value, HashMap):
+        return {k: encode_value(v, funcs) for k, v in value.value.items()}
+    if isinstance(value, BuiltInFunction):
+        return ("builtin", value.name)
+    if funcs is not None and isinstance(value, Function):
+        return ("func", encode_function(value, funcs))
+    if funcs is not None and isinstance(value, NameSpace):
+        return ("namespace", value.name, value.get("statements_", checked=True))
+    raise TypeError(value.type())
+
+
+def encode_function(func, funcs):
+    key = id(func)
+    if key in funcs:
+        return key
+    funcs[key] = None
+
+    names = set()
+    collect_var_names(func.body_node, names)
+    collect_var_names(func.defaults, names)
+    names.difference_update(func.arg_names)
+    names.discard(func.vargs_name)
+    names.discard(func.kargs_name)
+
+    captured = {}
+    ctx = func.context
+    for name in names:
+        value = None
+        if ctx is not None:
+            value = ctx.symbol_table.get(name)
+            if value is None and ctx.private_symbol_table:
+                value = ctx.private_symbol_table.get(name)
+        if value is None or isinstance(value, BuiltInFunction):
+            continue
+        captured[name] = encode_value(value, funcs)
+
+    defaults = [
+        ("value", encode_value(d, funcs)) if isinstance(d, Object) else d
+        for d in func.defaults
+    ]
+    funcs[key] = (
+        func.name,
+        func.body_node,
+        func.arg_names,
+        defaults,
+        func.vargs_name,
+        func.kargs_name,
+        func.should_auto_return,
+        captured,
+    )
+    return key
+
+
+def decode_value(value, funcs, root, built):
+    if isinstance(value, bool):
+        return Bool(value)
+    if value is None:
+        return Number.none
+    if isinstance(value, (int, float)):
+        return Number(value)
+    if isinstance(value, Fraction):
+        return CFloat(value)
+    if isinstance(value, str):
+        return String(value)
+    if isinstance(value, bytes):
+        return Bytes(value)
+    if isinstance(value, list):
+        return List([decode_value(v, funcs, root, built) for v in value])
+    if isinstance(value, dict):
+        return HashMap(
+            {k: decode_value(v, funcs, root, built) for k, v in value.items()}
+        )
+    if value[0] == "builtin":
+        return global_symbol_table.get(value[1])
+    if value[0] == "func":
+        return decode_function(value[1], funcs, root, built)
+
+    key = ("namespace", value[1])
+    if key not in built:
+        namespace = NameSpace(value[1]).set_context(root)
+        ns_context = Context(value[1], root)
+        ns_context.symbol_table = SymbolTable(root.symbol_table)
+        ns_context.private_symbol_table = SymbolTable(root.private_symbol_table)
+        namespace.set("statements_", value[2], checked=True)
+        namespace.set("context_", ns_context, checked=True)
+        built[key] = namespace
+    return built[key]
+
+
+def decode_function(key, funcs, root, built):
+    if key in built:
+        return built[key]
+    name, body_node, arg_names, defaults, vargs, kargs, auto_return, captured = funcs[
+        key
+    ]
+
+    func_context = Context(name or "<anonymous>", root)
+    func_context.symbol_table = SymbolTable(root.symbol_table)
+    func_context.private_symbol_table = SymbolTable(root.private_symbol_table)
+    func = Function(
+        name,
+        body_node,
+        arg_names,
+        [],
+        Token(TT_IDENTIFIER, vargs) if vargs else None,
+        Token(TT_IDENTIFIER, kargs) if kargs else None,
+        auto_return,
+    ).set_context(func_context)
+    built[key] = func
+
+    func.defaults = [
+        decode_value(d[1], funcs, root, built) if isinstance(d, tuple) else d
+        for d in defaults
+    ]
+    for var_name, value in captured.items():
+        func_context.symbol_table.set(var_name, decode_value(value, funcs, root, built))
+    return func
+
+
+def parallel_worker(payload, mode, chunk, initial=None):
+    func = parallel_worker_cache.get(payload)
+    if func is None:
+        funcs, spec = pickle.loads(payload)
+        root = Context("<parallel>")
+        root.symbol_table = SymbolTable(global_symbol_table)
+        root.private_symbol_table = SymbolTable(private_symbol_table)
+        func = decode_value(spec, funcs, root, {})
+        parallel_worker_cache.clear()
+        parallel_worker_cache[payload] = func
+
+    items = [decode_value(v, None, None, None) for v in chunk]
+    try:
+        if mode == "reduce":
+            if initial is None:
+                acc, items = items[0], items[1:]
+            else:
+                acc = decode_value(initial[0], None, None, None)
+            for item in items:
+                res = func.execute([acc, item], {})
+                if res.error:
+                    return "error", res.error.error_name, str(res.error.details)
+                acc = res.value
+            return "ok", encode_value(acc, None)
+
+        out = []
+        for i, item in enumerate(items):
+            res = func.execute([item], {})
+            if res.error:
+                return "error", res.error.error_name, str(res.error.details)
+            if mode == "filter":
+                if res.value.is_true():
+                    out.append(i)
+            else:
+                out.append(encode_value(res.value, None))
+        return "ok", out
+    except TypeError as e:
+        return (
+            "error",
+            "TypeError",
+            f"Value of type '{e}' cannot be sent back from a worker process",
+        )
+    except Exception as e:
+        return "error", "RuntimeError", f"Unexpected Python error in worker: {e}"
+
+
+def get_parallel_executor(workers):
+    with parallel_executors_lock:
+        if workers not in parallel_executors:
+            parallel_executors[workers] = ProcessPoolExecutor(max_workers=workers)
+        return parallel_executors[workers]
+
+
+task_state = local()
+cancel_tokens_active = 0
+cancel_tokens_lock = Lock()
+
+
+def current_cancel_token():
+    return getattr(task_state, "token", None)
+
+
+def push_cancel_token(token):
+    global cancel_tokens_active
+    previous = current_cancel_token()
+    task_state.token = token
+    with cancel_tokens_lock:
+        cancel_tokens_active += 1
+    return previous
+
+
+def pop_cancel_token(previous):
+    global cancel_tokens_active
+    task_state.token = previous
+    with cancel_tokens_lock:
+        cancel_tokens_active -= 1
+
+
+def cancel_reason():
+    if not cancel_tokens_active:
+        return None
+    token = current_cancel_token()
+    if token is None:
+        return None
+    return token.reason()
+
+
+def make_pool_task(func, positional_args, keyword_args, token, timeout=None):
+    def task_wrapper():
+        if timeout is not None:
+            token.deadline = time.monotonic() + timeout
+        previous = push_cancel_token(token)
+        try:
+            res = func.execute(positional_args, keyword_args)
+        finally:
+            pop_cancel_token(previous)
+        if res.error:
+            raise ThreadPoolError(res.error)
+        return res.value
+
+    return task_wrapper
+
+
+def cancellable_sleep(seconds):
+    token = current_cancel_token()
+    if token is None:
+        time.sleep(seconds)
+        return None
+    end = time.monotonic() + seconds
+    while True:
+        reason = token.reason()
+        if reason:
+            return reason
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            return None
+        token.event.wait(min(remaining, 0.05))
+
+
+current_worker_conn = None
+worker_context = multiprocessing.get_context("spawn")
+
+
+def remote_error(error_name, details, pos_start, pos_end, context):
+    error_class = RUNTIME_ERRORS.get(error_name)
+    if error_class is not None:
+        return error_class(pos_start, pos_end, details, context)
+    error = RTError(pos_start, pos_end, details, context)
+    error.error_name = error_name
+    return error
+
+
+def worker_message(kind, *values):
+    return pack_frame(List([String(kind), *values]))
+
+
+def read_worker_message(conn):
+    message, _ = unpack_frame(conn.recv_bytes())
+    kind, *values = message.value
+    return kind.value, values
+
+
+def worker_main(conn, payload, args):
+    global current_worker_conn
+    current_worker_conn = conn
+    funcs, spec = pickle.loads(payload)
+    root = Context("<worker>")
+    root.symbol_table = SymbolTable(global_symbol_table)
+    root.private_symbol_table = SymbolTable(private_symbol_table)
+    func = decode_value(spec, funcs, root, {})
+    try:
+        res = func.execute(unpack_frame(args)[0].value, {})
+        if res.error:
+            message = worker_message(
+                "error", String(res.error.error_name), String(str(res.error.details))
+            )
+        else:
+            message = worker_message("done", res.value)
+    except TypeError as e:
+        message = worker_message(
+            "error",
+            String("TypeError"),
+            String(f"Value of type '{e}' cannot be sent back from a worker process"),
+        )
+    except Exception as e:
+        message = worker_message(
+            "error",
+            String("RuntimeError"),
+            String(f"Unexpected Python error in worker: {e}"),
+        )
+    try:
+        conn.send_bytes(message)
+    finally:
+        conn.close()
+
+
+def worker_read(worker, timeout=None):
+    if worker.pending:
+        return "ok", worker.pending.popleft()
+    while not worker.finished:
+        if not worker.conn.poll(timeout):
+            return "timeout", None
+        try:
+            kind, values = read_worker_message(worker.conn)
+        except (EOFError, OSError, ValueError):
+            worker.process.join()
+            worker.finished = True
+            worker.outcome = (
+                "error",
+                "RuntimeError",
+                f"Worker exited unexpectedly with code {worker.process.exitcode}",
+            )
+            break
+        if kind == "msg":
+            return "ok", values[0]
+        worker.finished = True
+        if kind == "error":
+            worker.outcome = (kind, values[0].value, values[1].value)
+        else:
+            worker.outcome = (kind, values[0])
+    return "closed", None
+
+
+async_loop = None
+async_loop_lock = Lock()
+
+
+def get_async_loop():
+    global async_loop
+    with async_loop_lock:
+        if async_loop is None:
+            loop = asyncio.new_event_loop()
+            Thread(target=loop.run_forever, daemon=True).start()
+            async_loop = loop
+    return async_loop
+
+
+def submit_async(coro):
+    return Future(asyncio.run_coroutine_threadsafe(coro, get_async_loop()))
+
+
+def read_text_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def write_text_file(path, data, mode):
+    with open(path, mode, encoding="utf-8") as f:
+        f.write(data)
+
+
+async def async_sleep(seconds):
+    await asyncio.sleep(seconds)
+    return Number.none
+
+
+async def async_read_file(path):
+    loop = asyncio.get_running_loop()
+    return String(await loop.run_in_executor(None, read_text_file, path))
+
+
+async def async_write_file(path, data, mode):
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, write_text_file, path, data, mode)
+    return Number.none
+
+
+async def async_run_command(command):
+    proc = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return List(
+        [
+            String(stdout.decode("utf-8", errors="replace")),
+            String(stderr.decode("utf-8", errors="replace")),
+            Number(proc.returncode),
+        ]
+    )
+
+
+async def async_tcp_request(host, port, data, timeout):
+    async def exchange():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(data.encode("utf-8"))
+            await writer.drain()
+            if writer.can_write_eof():
+                writer.write_eof()
+            response = await reader.read()
+        finally:
+            writer.close()
+        return String(response.decode("utf-8", errors="replace"))
+
+    return await asyncio.wait_for(exchange(), timeout)
+
+
+def infer_csv_cell(cell):
+    if cell and (cell[0].isdigit() or cell[0] in "+-.") and "_" not in cell:
+        try:
+            number = int(cell)
+        except ValueError:
+            pass
+        else:
+            return Number(number) if str(number) == cell else String(cell)
+        digits = cell.lstrip("+-")
+        if digits[:1] == "0" and digits[1:2].isdigit():
+            return String(cell)
+        try:
+            number = float(cell)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(number):
+                return Number(number)
+    return String(cell)
+
+
+def iter_csv_rows(handle, path, records, infer, batch_size, delimiter):
+    convert = infer_csv_cell if infer else String
+    batch = []
+    try:
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = next(reader, None) if records else None
+        if records and header is None:
+            return
+        for row in reader:
+            if records:
+                if len(row) != len(header):
+                    raise IterError(
+                        f'Row {reader.line_num} of "{path}" has {len(row)} fields, expected {len(header)}'
+                    )
+                value = HashMap(
+                    {name: convert(cell) for name, cell in zip(header, row)}
+                )
+            else:
+                value = List([convert(cell) for cell in row])
+            if not batch_size:
+                yield value
+                continue
+            batch.append(value)
+            if len(batch) == batch_size:
+                yield List(batch)
+                batch = []
+        if batch:
+            yield List(batch)
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise IterError(f'Error reading CSV file "{path}": {e}') from e
+    finally:
+        handle.close()
+
+
+def json_value(obj):
+    kind = type(obj)
+    if kind is str:
+        return String(obj)
+    if kind is int or kind is float:
+        return Number(obj)
+    if kind is list:
+        return List([json_value(item) for item in obj])
+    if obj is None:
+        return Number.none
+    if obj is True:
+        return Number.true
+    if obj is False:
+        return Number.false
+    return obj
+
+
+def json_object(pairs):
+    table = HashMap({})
+    table.value = {key: json_value(value) for key, value in pairs}
+    return table
+
+
+def json_default(obj):
+    kind = type(obj)
+    if kind in PLAIN_SCALARS:
+        return obj.value
+    if kind is List:
+        return [
+            item.value if type(item) in PLAIN_SCALARS else item for item in obj.value
+        ]
+    if kind is HashMap:
+        return {
+            key: item.value if type(item) in PLAIN_SCALARS else item
+            for key, item in obj.value.items()
+        }
+    if isinstance(obj, List | HashMap):
+        return obj.value
+    if kind is Set:
+        return obj.items()
+    if isinstance(obj, NoneObject):
+        return None
+    if isinstance(obj, PyObject):
+        return obj.get_obj()
+    if not isinstance(obj, Object) or isinstance(obj, Bytes):
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return str(obj)
+
+
+PLAIN_SCALARS = {String, Number, Bool, SharedBool}
+JSON_DECODER = json.JSONDecoder(object_pairs_hook=json_object)
+JSON_ENCODER = json.JSONEncoder(default=json_default)
+
+
+def iter_json_items(handle, path, batch_size):
+    decode = JSON_DECODER.raw_decode
+    buffer, pos, eof = "", 0, False
+
+    def more(size=JSON_CHUNK_SIZE):
+        nonlocal buffer, pos, eof
+        chunk = handle.read(size)
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+        return chunk
+
+    def skip():
+        nonlocal pos
+        while True:
+            end = len(buffer)
+            while pos < end and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < end:
+                return buffer[pos]
+            if not more():
+                return ""
+
+    batch = []
+    try:
+        if skip() != "[":
+            raise IterError(f'JSON document "{path}" is not an array')
+        pos += 1
+        if skip() == "]":
+            return
+        while True:
+            while True:
+                try:
+                    value, end = decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    more(max(JSON_CHUNK_SIZE, len(buffer)))
+                    continue
+                if len(buffer) - end < 3 and not eof:
+                    more(max(JSON_CHUNK_SIZE, len(buffer)))
+                    continue
+                break
+            pos = end
+            value = json_value(value)
+            if batch_size:
+                batch.append(value)
+                if len(batch) == batch_size:
+                    yield List(batch)
+                    batch = []
+            else:
+                yield value
+            sep = skip()
+            if sep == "]":
+                break
+            if sep != ",":
+                raise IterError(
+                    f"Failed to parse JSON \"{path}\": expected ',' or ']' between items"
+                )
+            pos += 1
+            skip()
+        if batch:
+            yield List(batch)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise IterError(f'Failed to parse JSON "{path}": {e}') from e
+    finally:
+        handle.close()
+
+
+def iter_json_lines(handle, path, batch_size, close):
+    decode = JSON_DECODER.decode
+    batch = []
+    try:
+        for line_num, line in enumerate(handle, 1):
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            if not line.strip():
+                continue
+            try:
+                value = json_value(decode(line))
+            except json.JSONDecodeError as e:
+                raise IterError(
+                    f'Failed to parse JSON on line {line_num} of "{path}": {e.msg} (column {e.pos + 1})'
+                ) from e
+            if not batch_size:
+                yield value
+                continue
+            batch.append(value)
+            if len(batch) == batch_size:
+                yield List(batch)
+                batch = []
+        if batch:
+            yield List(batch)
+    except UnicodeDecodeError as e:
+        raise IterError(f'Error reading JSON lines file "{path}": {e}') from e
+    finally:
+        if close:
+            handle.close()
+
+
+PACK_FRAME = struct.Struct("<cBI")
+PACK_MARKER = b"Z"
+PACK_VERSION = 2
+PACK_KEY_LIMIT = 1 << 16
+PACK_KEY_REF = struct.Struct("<H")
+PACK_BULK_MIN = 16
+PACK_LIST_TAGS = frozenset(b"lADURV")
+PACK_SIZE = struct.Struct("<I")
+PACK_INT32 = struct.Struct("<i")
+PACK_INT64 = struct.Struct("<q")
+PACK_FLOAT = struct.Struct("<d")
+
+
+def pack_int(number, out):
+    if -(2**31) <= number < 2**31:
+        out += b"i"
+        out += PACK_INT32.pack(number)
+    elif -(2**63) <= number < 2**63:
+        out += b"q"
+        out += PACK_INT64.pack(number)
+    else:
+        data = number.to_bytes(number.bit_length() // 8 + 1, "little", signed=True)
+        out += b"I"
+        out += PACK_SIZE.pack(len(data))
+        out += data
+
+
+def pack_str(text, out):
+    data = text.encode("utf-8", "surrogatepass")
+    if len(data) < 256:
+        out += b"s"
+        out.append(len(data))
+    else:
+        out += b"S"
+        out += PACK_SIZE.pack(len(data))
+    out += data
+
+
+def pack_key(key, out, keys):
+    index = keys.get(key)
+    if index is not None:
+        out += b"k"
+        out += PACK_KEY_REF.pack(index)
+        return
+    if len(keys) < PACK_KEY_LIMIT:
+        keys[key] = len(keys)
+    pack_str(key, out)
+
+
+def pack_list(items, out, keys):
+    if len(items) >= PACK_BULK_MIN and pack_column(items, out, keys):
+        return
+    out += b"l"
+    out += PACK_SIZE.pack(len(items))
+    for item in items:
+        pack_value(item, out, keys)
+
+
+def pack_column(items, out, keys):
+    kinds = set(map(type, items))
+    if len(kinds) != 1:
+        return False
+    kind = kinds.pop()
+    values = list(map(operator.attrgetter("value"), items))
+    count = len(values)
+    if kind is List or kind is ListSlice:
+        out += b"V"
+        out += PACK_SIZE.pack(count)
+        out += struct.pack(f"<{count}I", *map(len, values))
+        pack_list(list(chain.from_iterable(values)), out, keys)
+        return True
+    if kind is HashMap:
+        fields = set(map(tuple, values))
+        if len(fields) != 1:
+            return False
+        fields = fields.pop()
+        if not fields:
+            return False
+        out += b"R"
+        out += PACK_SIZE.pack(count)
+        out += PACK_SIZE.pack(len(fields))
+        for field in fields:
+            pack_key(field, out, keys)
+        for field in fields:
+            pack_list(list(map(operator.itemgetter(field), values)), out, keys)
+        return True
+    if kind is String:
+        out += b"U"
+        out += PACK_SIZE.pack(count)
+        out += struct.pack(f"<{count}I", *map(len, values))
+        pack_str("".join(values), out)
+        return True
+    if kind is not Number:
+        return False
+    number_kinds = set(map(type, values))
+    if number_kinds == {float}:
+        out += b"D"
+        out += PACK_SIZE.pack(count)
+        out += struct.pack(f"<{count}d", *values)
+        return True
+    if number_kinds != {int}:
+        return False
+    low, high = min(values), max(values)
+    if -(2**31) <= low and high < 2**31:
+        code = "i"
+    elif -(2**63) <= low and high < 2**63:
+        code = "q"
+    else:
+        return False
+    out += b"A"
+    out += PACK_SIZE.pack(count)
+    out += code.encode()
+    out += struct.pack(f"<{count}{code}", *values)
+    return True
+
+
+def pack_value(value, out, keys):
+    kind = type(value)
+    if kind is String:
+        pack_str(value.value, out)
+    elif kind is Number:
+        number = value.value
+        if type(number) is float:
+            out += b"d"
+            out += PACK_FLOAT.pack(number)
+        else:
+            pack_int(number, out)
+    elif kind is List or kind is ListSlice:
+        pack_list(value.value, out, keys)
+    elif kind is HashMap:
+        out += b"m"
+        out += PACK_SIZE.pack(len(value.value))
+        for key, item in value.value.items():
+            pack_key(key, out, keys)
+            pack_value(item, out, keys)
+    elif isinstance(value, Bool):
+        out += b"T" if value.value else b"F"
+    elif isinstance(value, NoneObject):
+        out += b"N"
+    elif kind is Bytes:
+        out += b"b"
+        out += PACK_SIZE.pack(len(value.value))
+        out += value.value
+    elif kind is CFloat:
+        out += b"c"
+        pack_int(value.value.numerator, out)
+        pack_int(value.value.denominator, out)
+    elif isinstance(value, BaseFunction):
+        raise TypeError("<func>")
+    else:
+        raise TypeError(value.type())
+
+
+def unpack_text(data, pos):
+    tag = data[pos]
+    if tag == 0x73:
+        start = pos + 2
+        end = start + data[pos + 1]
+    elif tag == 0x53:
+        start = pos + 5
+        end = start + PACK_SIZE.unpack_from(data, pos + 1)[0]
+    else:
+        raise ValueError(f"expected a string at offset {pos}")
+    if end > len(data):
+        raise ValueError("truncated value")
+    return data[start:end].decode("utf-8", "surrogatepass"), end
+
+
+def unpack_int(data, pos):
+    tag = data[pos]
+    if tag == 0x69:
+        return PACK_INT32.unpack_from(data, pos + 1)[0], pos + 5
+    if tag == 0x71:
+        return PACK_INT64.unpack_from(data, pos + 1)[0], pos + 9
+    if tag == 0x49:
+        start = pos + 5
+        end = start + PACK_SIZE.unpack_from(data, pos + 1)[0]
+        if end > len(data):
+            raise ValueError("truncated value")
+        return int.from_bytes(data[start:end], "little", signed=True), end
+    raise ValueError(f"expected an integer at offset {pos}")
+
+
+def unpack_scalar(data, pos):
+    tag = data[pos]
+    if tag == 0x53:
+        text, pos = unpack_text(data, pos)
+        return String(text), pos
+    if tag == 0x71 or tag == 0x49:
+        number, pos = unpack_int(data, pos)
+        return Number(number), pos
+    if tag == 0x62:
+        start = pos + 5
+        end = start + PACK_SIZE.unpack_from(data, pos + 1)[0]
+        if end > len(data):
+            raise ValueError("truncated value")
+        return Bytes(data[start:end]), end
+    if tag == 0x63:
+        numerator, pos = unpack_int(data, pos + 1)
+        denominator, pos = unpack_int(data, pos)
+        if denominator <= 0:
+            raise ValueError("invalid cfloat denominator")
+        return CFloat(Fraction(numerator, denominator)), pos
+    raise ValueError(f"unknown value tag {tag:#04x} at offset {pos}")
+
+
+def unpack_key(data, pos, keys):
+    if data[pos] == 0x6B:
+        index = data[pos + 1] | data[pos + 2] << 8
+        if index >= len(keys):
+            raise ValueError(f"invalid key reference at offset {pos}")
+        return keys[index], pos + 3
+    name, pos = unpack_text(data, pos)
+    if len(keys) < PACK_KEY_LIMIT:
+        keys.append(name)
+    return name, pos
+
+
+def unpack_list(data, pos, keys):
+    tag = data[pos]
+    (count,) = PACK_SIZE.unpack_from(data, pos + 1)
+    start = pos
+    pos += 5
+    if tag == 0x6C:
+        items, _, pos = unpack_items(data, pos, count, keys, False)
+        return items, pos
+    if tag == 0x41:
+        code = data[pos]
+        if code != 0x69 and code != 0x71:
+            raise ValueError(f"invalid integer array at offset {start}")
+        layout = struct.Struct(f"<{count}{chr(code)}")
+        numbers = layout.unpack_from(data, pos + 1)
+        return list(map(Number, numbers)), pos + 1 + layout.size
+    if tag == 0x44:
+        numbers = struct.unpack_from(f"<{count}d", data, pos)
+        return list(map(Number, numbers)), pos + 8 * count
+    if tag == 0x55:
+        lengths = struct.unpack_from(f"<{count}I", data, pos)
+        text, pos = unpack_text(data, pos + 4 * count)
+        ends = list(accumulate(lengths))
+        if (ends[-1] if ends else 0) != len(text):
+            raise ValueError(f"invalid string array at offset {start}")
+        starts = [0] + ends[:-1]
+        return list(map(String, map(text.__getitem__, map(slice, starts, ends)))), pos
+    if tag == 0x56:
+        lengths = struct.unpack_from(f"<{count}I", data, pos)
+        flat, pos = unpack_list(data, pos + 4 * count, keys)
+        ends = list(accumulate(lengths))
+        if (ends[-1] if ends else 0) != len(flat):
+            raise ValueError(f"invalid nested list at offset {start}")
+        starts = [0] + ends[:-1]
+        return list(map(List, map(flat.__getitem__, map(slice, starts, ends)))), pos
+    if tag == 0x52:
+        (width,) = PACK_SIZE.unpack_from(data, pos)
+        pos += 4
+        if width == 0:
+            raise ValueError(f"invalid record list at offset {start}")
+        fields = []
+        for _ in range(width):
+            name, pos = unpack_key(data, pos, keys)
+            fields.append(name)
+        columns = []
+        for _ in range(width):
+            column, pos = unpack_list(data, pos, keys)
+            if len(column) != count:
+                raise ValueError(f"invalid record list at offset {start}")
+            columns.append(column)
+        items = []
+        for row in zip(*columns):
+            table = HashMap({})
+            table.value = dict(zip(fields, row))
+            items.append(table)
+        return items, pos
+    raise ValueError(f"expected a list at offset {start}")
+
+
+def unpack_items(data, pos, count, keys, is_map):
+    size = len(data)
+    int32 = PACK_INT32.unpack_from
+    float64 = PACK_FLOAT.unpack_from
+    items = []
+    append = items.append
+    names = [] if is_map else None
+    for _ in range(count):
+        if is_map:
+            name, pos = unpack_key(data, pos, keys)
+            names.append(name)
+        tag = data[pos]
+        if tag == 0x73:
+            end = pos + 2 + data[pos + 1]
+            if end > size:
+                raise ValueError("truncated value")
+            append(String(data[pos + 2 : end].decode("utf-8", "surrogatepass")))
+            pos = end
+        elif tag == 0x69:
+            append(Number(int32(data, pos + 1)[0]))
+            pos += 5
+        elif tag == 0x64:
+            append(Number(float64(data, pos + 1)[0]))
+            pos += 9
+        elif tag == 0x54:
+            append(Number.true)
+            pos += 1
+        elif tag == 0x46:
+            append(Number.false)
+            pos += 1
+        elif tag == 0x4E:
+            append(Number.none)
+            pos += 1
+        elif tag == 0x6D:
+            (length,) = PACK_SIZE.unpack_from(data, pos + 1)
+            values, fields, pos = unpack_items(data, pos + 5, length, keys, True)
+            table = HashMap({})
+            table.value = dict(zip(fields, values))
+            append(table)
+        elif tag in PACK_LIST_TAGS:
+            values, pos = unpack_list(data, pos, keys)
+            append(List(values))
+        else:
+            value, pos = unpack_scalar(data, pos)
+            append(value)
+    return items, names, pos
+
+
+def pack_frame(value):
+    out = bytearray()
+    pack_value(value, out, {})
+    return PACK_FRAME.pack(PACK_MARKER, PACK_VERSION, len(out)) + out
+
+
+def unpack_body(body):
+    data = bytes(body)
+    try:
+        items, _, pos = unpack_items(data, 0, 1, [], False)
+    except (struct.error, IndexError) as e:
+        raise ValueError("truncated value") from e
+    except RecursionError as e:
+        raise ValueError("value is nested too deeply") from e
+    if pos != len(data):
+        raise ValueError("unexpected data after value")
+    return items[0]
+
+
+def check_frame_header(marker, version):
+    if marker != PACK_MARKER:
+        raise ValueError("invalid frame marker")
+    if not 1 <= version <= PACK_VERSION:
+        raise ValueError(f"unsupported format version {version}")
+
+
+def unpack_frame(data, pos=0):
+    if len(data) - pos < PACK_FRAME.size:
+        raise ValueError("truncated frame header")
+    marker, version, size = PACK_FRAME.unpack_from(data, pos)
+    check_frame_header(marker, version)
+    start = pos + PACK_FRAME.size
+    end = start + size
+    if end > len(data):
+        raise ValueError("truncated frame")
+    return unpack_body(data[start:end]), end
+
+
+def read_frame(handle):
+    header = handle.read(PACK_FRAME.size)
+    if not header:
+        return None
+    if len(header) < PACK_FRAME.size:
+        raise ValueError("truncated frame header")
+    marker, version, size = PACK_FRAME.unpack(header)
+    check_frame_header(marker, version)
+    body = handle.read(size)
+    if len(body) < size:
+        raise ValueError("truncated frame")
+    return unpack_body(body)
+
+
+def iter_frames(handle, path, close):
+    try:
+        while True:
+            value = read_frame(handle)
+            if value is None:
+                return
+            yield value
+    except (ValueError, EOFError, TypeError) as e:
+        raise IterError(f'Failed to unpack "{path}": {e}') from e
+    finally:
+        if close:
+            handle.close()
+
+
 class BaseFunction(Object):
     __slots__ = "name"
 
@@ -231,11 +1314,11 @@ class Function(BaseFunction):
         value = res.register(interpreter.visit(self.body_node, exec_ctx))
         if res.should_return() and res.func_return_value is None:
             return res
-        ret_value = (
-            (value if self.should_auto_return else None)
-            or res.func_return_value
-            or Number.none
-        )
+        ret_value = value if self.should_auto_return else None
+        if ret_value is None:
+            ret_value = res.func_return_value
+        if ret_value is None:
+            ret_value = Number.none
         return res.success(ret_value)
 
     def copy(self):
@@ -258,6 +1341,95 @@ class Function(BaseFunction):
     def type(self):
         return "<func>"
 
+    def __eq__(self, other):
+        return (
+            isinstance(other, Function)
+            and self.body_node is other.body_node
+            and self.context is other.context
+        )
+
+    def __hash__(self):
+        return hash((id(self.body_node), id(self.context)))
+
+
+class MemoizedFunction(BaseFunction):
+    __slots__ = ("func", "maxsize", "ttl", "cache", "hits", "misses", "lock")
+
+    def __init__(self, func, maxsize, ttl):
+        super().__init__(func.name)
+        self.func = func
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+    def execute(self, positional_args, keyword_args):
+        try:
+            key = tuple(map(frozen_key, positional_args))
+            if keyword_args:
+                key += (
+                    frozenset(
+                        (name, frozen_key(value))
+                        for name, value in keyword_args.items()
+                    ),
+                )
+            hash(key)
+        except TypeError:
+            key = None
+
+        if key is not None:
+            with self.lock:
+                entry = self.cache.get(key)
+                if entry is not None:
+                    if entry[1] is None or entry[1] > time.monotonic():
+                        self.cache.move_to_end(key)
+                        self.hits += 1
+                        return RTResult().success(entry[0])
+                    del self.cache[key]
+                self.misses += 1
+
+        res = self.func.execute(positional_args, keyword_args)
+        if res.error or key is None:
+            return res
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            self.cache[key] = (res.value, expires)
+            self.cache.move_to_end(key)
+            if self.maxsize is not None and len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        return res
+
+    def info(self):
+        with self.lock:
+            return HashMap(
+                {
+                    "hits": Number(self.hits),
+                    "misses": Number(self.misses),
+                    "size": Number(len(self.cache)),
+                    "maxsize": (
+                        Number.none if self.maxsize is None else Number(self.maxsize)
+                    ),
+                }
+            )
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def copy(self):
+        return self
+
+    def __repr__(self):
+        return repr(self.func)
+
+    def type(self):
+        return "<func>"
+
 
 class BuiltInFunction(BaseFunction):
     __slots__ = ("name", "body_node", "arg_names", "defaults", "should_auto_return")
@@ -301,6 +1473,12 @@ class BuiltInFunction(BaseFunction):
     def __repr__(self):
         return f"<built-in function {self.name}>"
 
+    def __eq__(self, other):
+        return isinstance(other, BuiltInFunction) and self.name == other.name
+
+    def __hash__(self):
+        return hash((BuiltInFunction, self.name))
+
     @staticmethod
     def set_args(arg_names, defaults=None):
         if defaults is None:
@@ -408,6 +1586,8 @@ class BuiltInFunction(BaseFunction):
                 )
             )
 
+        if lst.shared:
+            lst.detach()
         if int(reverse.value) == 1:
             lst.value.sort(key=lambda x: x.value, reverse=True)
         elif int(reverse.value) == 0:
@@ -423,12 +1603,134 @@ class BuiltInFunction(BaseFunction):
             )
         return RTResult().success(lst)
 
+    def _get_list(self, exec_ctx, name, fn_name, position="First"):
+        value = exec_ctx.symbol_table.get(name)
+        if not isinstance(value, List):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"{position} argument of '{fn_name}' must be a list",
+                exec_ctx,
+            )
+        return value, None
+
+    def _list_extreme(self, exec_ctx, fn_name, pick):
+        lst, error = self._get_list(exec_ctx, "value", fn_name)
+        if error:
+            return RTResult().failure(error)
+        items = lst.value
+        if not items or not all(
+            isinstance(item, Number) and isinstance(item.value, int | float)
+            for item in items
+        ):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"First argument of '{fn_name}' must be a list of numbers",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(pick(items, key=operator.attrgetter("value")))
+
+    @set_args(["value"])
+    def execute_listm_min_fp(self, exec_ctx):
+        return self._list_extreme(exec_ctx, "min", min)
+
+    @set_args(["value"])
+    def execute_listm_max_fp(self, exec_ctx):
+        return self._list_extreme(exec_ctx, "max", max)
+
+    @set_args(["value"])
+    def execute_listm_reverse_fp(self, exec_ctx):
+        lst, error = self._get_list(exec_ctx, "value", "reverse")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(List(lst.value[::-1]))
+
+    @set_args(["value", "other", "longest"], [None, None, Bool.false])
+    def execute_listm_zip_fp(self, exec_ctx):
+        fn_name = (
+            "zip_longest" if exec_ctx.symbol_table.get("longest").is_true() else "zip"
+        )
+        lst, error = self._get_list(exec_ctx, "value", fn_name)
+        if error:
+            return RTResult().failure(error)
+        other, error = self._get_list(exec_ctx, "other", fn_name, "Second")
+        if error:
+            return RTResult().failure(error)
+        if fn_name == "zip":
+            pairs = zip(lst.value, other.value)
+        else:
+            pairs = zip_longest(lst.value, other.value, fillvalue=Number.none)
+        return RTResult().success(List([List([a, b]) for a, b in pairs]))
+
+    @set_args(["value", "reverse"], [None, Bool.false])
+    def execute_listm_sort_fp(self, exec_ctx):
+        lst, error = self._get_list(exec_ctx, "value", "sort")
+        if error:
+            return RTResult().failure(error)
+        items = lst.value
+        if not (
+            all(isinstance(item, String) for item in items)
+            or all(
+                isinstance(item, Number) and isinstance(item.value, int | float)
+                for item in items
+            )
+        ):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "All elements of the list must be a either numbers or strings",
+                    exec_ctx,
+                )
+            )
+        return self.execute_sort_fp(exec_ctx)
+
+    def _find_matches(self, exec_ctx, fn_name, first_only):
+        lst, error = self._get_list(exec_ctx, "value", fn_name)
+        if error:
+            return None, error
+        target = exec_ctx.symbol_table.get("target")
+        as_text = isinstance(target, String)
+        matches = []
+        for i, item in enumerate(lst.value):
+            if as_text and not isinstance(item, String):
+                matched = str(item) == target.value
+            else:
+                result, error = item.get_comparison_eq(target)
+                if error:
+                    return None, error
+                matched = result.is_true()
+            if matched:
+                matches.append(i)
+                if first_only:
+                    break
+        return matches, None
+
+    @set_args(["value", "target"])
+    def execute_listm_count_fp(self, exec_ctx):
+        matches, error = self._find_matches(exec_ctx, "count", False)
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(Number(len(matches)))
+
+    @set_args(["value", "target"])
+    def execute_listm_index_of_fp(self, exec_ctx):
+        matches, error = self._find_matches(exec_ctx, "index_of", True)
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(Number(matches[0]) if matches else Number.none)
+
     @set_args(["object", "value"])
     def execute_append(self, exec_ctx):
         obj_ = exec_ctx.symbol_table.get("object")
         value = exec_ctx.symbol_table.get("value")
 
         if isinstance(obj_, List):
+            if obj_.shared:
+                obj_.detach()
             obj_.value.append(value)
             return RTResult().success(value)
         else:
@@ -463,6 +1765,8 @@ class BuiltInFunction(BaseFunction):
                     exec_ctx,
                 )
             )
+        if list_.shared:
+            list_.detach()
         try:
             element = list_.value.pop(int(index.value))
         except:
@@ -498,12 +1802,14 @@ class BuiltInFunction(BaseFunction):
                     exec_ctx,
                 )
             )
+        if listA.shared:
+            listA.detach()
         listA.value.extend(listB.value)
         return RTResult().success(Number.none)
 
     @set_args(["list", "index", "element"])
     def execute_insert(self, exec_ctx):
-        list_ = exec_ctx.symbol_table.get("list_")
+        list_ = exec_ctx.symbol_table.get("list")
         element = exec_ctx.symbol_table.get("element")
         index = exec_ctx.symbol_table.get("index")
         if not isinstance(list_, List):
@@ -524,6 +1830,8 @@ class BuiltInFunction(BaseFunction):
                     exec_ctx,
                 )
             )
+        if list_.shared:
+            list_.detach()
         list_.value.insert(int(index.value), element)
         return RTResult().success(Number.none)
 
@@ -575,14 +1883,20 @@ class BuiltInFunction(BaseFunction):
     @set_args(["value"])
     def execute_len(self, exec_ctx):
         value_ = exec_ctx.symbol_table.get("value")
-        if isinstance(value_, List | String | Bytes | HashMap):
+        if isinstance(value_, List):
+            return RTResult().success(Number(value_.size()))
+        if isinstance(value_, String | Bytes | HashMap | Array):
+            return RTResult().success(Number(len(value_.value)))
+        if isinstance(value_, Set):
             return RTResult().success(Number(len(value_.value)))
+        if isinstance(value_, StringBuilder):
+            return RTResult().success(Number(value_.length))
         else:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'len' must be a list, string, hashmap or bytes",
+                    "First argument of 'len' must be a list, string, hashmap, bytes, array, set or string builder",
                     exec_ctx,
                 )
             )
@@ -599,7 +1913,11 @@ class BuiltInFunction(BaseFunction):
                     exec_ctx,
                 )
             )
-        time.sleep(seconds.value)
+        reason = cancellable_sleep(seconds.value)
+        if reason:
+            return RTResult().failure(
+                RTError(self.pos_start, self.pos_end, reason, exec_ctx)
+            )
         return RTResult().success(Number.none)
 
     @set_args(["value"], [0])
@@ -615,12 +1933,12 @@ class BuiltInFunction(BaseFunction):
         start = exec_ctx.symbol_table.get("start")
         end = exec_ctx.symbol_table.get("end")
         step = exec_ctx.symbol_table.get("step")
-        if not isinstance(l, String | List | HashMap):
+        if not isinstance(l, String | List | HashMap | Bytes | Array):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'slice' must be a string, list, hashmap or bytes",
+                    "First argument of 'slice' must be a string, list, hashmap, bytes or array",
                     exec_ctx,
                 )
             )
@@ -658,13 +1976,15 @@ class BuiltInFunction(BaseFunction):
             sliced_l = l.value[a:b:s]
             return RTResult().success(String(sliced_l))
         elif isinstance(l, HashMap):
-            sliced_l = dict(l.value.items()[a:b:s])
+            sliced_l = dict(list(l.value.items())[a:b:s])
             return RTResult().success(HashMap(sliced_l))
         elif isinstance(l, Bytes):
-            sliced_l = l.value[a:b:s]
-            return RTResult().success(Bytes(sliced_l))
-        sliced_l = l.value[a:b:s]
-        return RTResult().success(List(sliced_l))
+            if s in (None, 1) and len(range(len(l.value))[a:b]) >= BYTES_VIEW_MIN:
+                return RTResult().success(Bytes(memoryview(l.value)[a:b]))
+            return RTResult().success(Bytes(bytes(l.value[a:b:s])))
+        elif isinstance(l, Array):
+            return RTResult().success(Array(l.value[a:b:s]))
+        return RTResult().success(l.sliced(a, b, s))
 
     @set_args(["file_path"])
     def execute_open_fp(self, exec_ctx):
@@ -736,24 +2056,265 @@ class BuiltInFunction(BaseFunction):
                 )
             )
 
-    @set_args(["file_path"])
-    def execute_exists_fp(self, exec_ctx):
+    def _get_open_file(self, exec_ctx, fn_name):
+        file = exec_ctx.symbol_table.get("file")
+        if not isinstance(file, File) or file.handle is None:
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a file opened with 'ffio.open'",
+                exec_ctx,
+            )
+        if file.handle.closed:
+            return None, IError(
+                self.pos_start,
+                self.pos_end,
+                f"Cannot '{fn_name}' a closed file",
+                exec_ctx,
+            )
+        return file, None
+
+    def _open_handle(self, exec_ctx, fn_name):
         file_path = exec_ctx.symbol_table.get("file_path")
-        if isinstance(file_path, String):
-            file_path = file_path.value
-        elif isinstance(file_path, File):
-            file_path = file_path.path
-        else:
+        mode = exec_ctx.symbol_table.get("mode")
+        buffering = exec_ctx.symbol_table.get("buffering")
+        if not isinstance(file_path, String):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a string",
+                exec_ctx,
+            )
+        if not isinstance(mode, String) or mode.value not in FILE_MODES:
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"Second argument of '{fn_name}' must be one of 'r', 'rb', 'w', 'wb', 'a' or 'ab'",
+                exec_ctx,
+            )
+        if not isinstance(buffering, Number) or buffering.value < -1:
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"Buffer size of '{fn_name}' must be a number (-1 for the default)",
+                exec_ctx,
+            )
+        binary = "b" in mode.value
+        try:
+            handle = open(
+                file_path.value,
+                mode.value,
+                buffering=int(buffering.value),
+                encoding=None if binary else "utf-8",
+            )
+        except Exception as e:
+            return None, IError(
+                self.pos_start,
+                self.pos_end,
+                f'Failed to open file "{file_path.value}": ' + str(e),
+                exec_ctx,
+            )
+        file_name = os.path.splitext(file_path.value)[0]
+        return File(file_name, file_path.value, handle), None
+
+    @set_args(["file_path", "mode", "buffering"], [None, String("r"), Number(-1)])
+    def execute_file_open_fp(self, exec_ctx):
+        file, error = self._open_handle(exec_ctx, "open")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(file)
+
+    @set_args(
+        ["file_path", "mode", "func", "buffering"], [None, None, None, Number(-1)]
+    )
+    def execute_file_with_fp(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+        if not isinstance(func, BaseFunction):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'exists' must be a string",
+                    "Third argument of 'with_file' must be a function",
                     exec_ctx,
                 )
             )
+        file, error = self._open_handle(exec_ctx, "with_file")
+        if error:
+            return RTResult().failure(error)
         try:
-            return RTResult().success(
+            res = func.execute([file], {})
+        finally:
+            try:
+                file.close()
+            except Exception:
+                pass
+        if res.error:
+            return RTResult().failure(res.error)
+        return RTResult().success(res.value if res.value else Number.none)
+
+    @set_args(["file", "data"])
+    def execute_file_write_fp(self, exec_ctx):
+        file, error = self._get_open_file(exec_ctx, "write")
+        if error:
+            return RTResult().failure(error)
+        data = exec_ctx.symbol_table.get("data")
+        expected = Bytes if file.is_binary() else String
+        if not isinstance(data, expected):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Second argument of 'write' must be {'bytes' if expected is Bytes else 'a string'} for a file opened in mode '{file.handle.mode}'",
+                    exec_ctx,
+                )
+            )
+        try:
+            file.handle.write(data.value)
+        except Exception as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to write to file "{file.path}": ' + str(e),
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number.none)
+
+    @set_args(["file"])
+    def execute_file_flush_fp(self, exec_ctx):
+        file, error = self._get_open_file(exec_ctx, "flush")
+        if error:
+            return RTResult().failure(error)
+        try:
+            file.handle.flush()
+        except Exception as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to flush file "{file.path}": ' + str(e),
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number.none)
+
+    @set_args(["file", "size"], [None, Number(65536)])
+    def execute_file_read_chunk_fp(self, exec_ctx):
+        file, error = self._get_open_file(exec_ctx, "read_chunk")
+        if error:
+            return RTResult().failure(error)
+        size = exec_ctx.symbol_table.get("size")
+        if not isinstance(size, Number) or size.value <= 0:
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'read_chunk' must be a positive number",
+                    exec_ctx,
+                )
+            )
+        try:
+            return RTResult().success(file.read_chunk(int(size.value)))
+        except Exception as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to read file "{file.path}": ' + str(e),
+                    exec_ctx,
+                )
+            )
+
+    @set_args(["file"])
+    def execute_file_read_line_fp(self, exec_ctx):
+        file, error = self._get_open_file(exec_ctx, "read_line")
+        if error:
+            return RTResult().failure(error)
+        try:
+            line = file.read_line()
+        except Exception as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to read file "{file.path}": ' + str(e),
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number.none if line is None else line)
+
+    @set_args(["file"])
+    def execute_file_close_fp(self, exec_ctx):
+        file = exec_ctx.symbol_table.get("file")
+        if not isinstance(file, File):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'close' must be a file",
+                    exec_ctx,
+                )
+            )
+        try:
+            file.close()
+        except Exception as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to close file "{file.path}": ' + str(e),
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number.none)
+
+    @set_args(["file_path"])
+    def execute_mmap_fp(self, exec_ctx):
+        file_path = exec_ctx.symbol_table.get("file_path")
+        if not isinstance(file_path, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'mmap' must be a string",
+                    exec_ctx,
+                )
+            )
+        try:
+            with open(file_path.value, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return RTResult().success(Bytes(b""))
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to map file "{file_path.value}": ' + str(e),
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bytes(memoryview(mapped)))
+
+    @set_args(["file_path"])
+    def execute_exists_fp(self, exec_ctx):
+        file_path = exec_ctx.symbol_table.get("file_path")
+        if isinstance(file_path, String):
+            file_path = file_path.value
+        elif isinstance(file_path, File):
+            file_path = file_path.path
+        else:
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'exists' must be a string",
+                    exec_ctx,
+                )
+            )
+        try:
+            return RTResult().success(
                 Number.true if os.path.exists(file_path) else Number.false
             )
         except Exception as e:
@@ -1684,10 +3245,13 @@ class BuiltInFunction(BaseFunction):
             k.value: v for k, v in kwargs.value.items() if hasattr(k, "value")
         }
 
+        token = CancelToken(current_cancel_token())
+
         def thread_wrapper():
+            previous = push_cancel_token(token)
             try:
                 result = func.execute(positional_args, keyword_args)
-                if result and result.error:
+                if result and result.error and not token.reason():
                     sys.stderr.write(str(result.error) + "\n")
                     sys.stderr.flush()
 
@@ -1700,11 +3264,13 @@ class BuiltInFunction(BaseFunction):
 
                 sys.stderr.write(traceback.format_exc() + "\n")
                 sys.stderr.flush()
+            finally:
+                pop_cancel_token(previous)
 
         try:
             thread = Thread(target=thread_wrapper, daemon=True)
             thread.start()
-            return RTResult().success(ThreadWrapper(thread))
+            return RTResult().success(ThreadWrapper(thread, token))
         except Exception as e:
             return RTResult().failure(
                 RTError(
@@ -1728,9 +3294,11 @@ class BuiltInFunction(BaseFunction):
                 )
             )
         try:
-            import time
-
-            time.sleep(seconds.value)
+            reason = cancellable_sleep(seconds.value)
+            if reason:
+                return RTResult().failure(
+                    RTError(self.pos_start, self.pos_end, reason, exec_ctx)
+                )
             return RTResult().success(Number.none)
         except Exception as e:
             return RTResult().failure(
@@ -2112,6 +3680,11 @@ class BuiltInFunction(BaseFunction):
             Bytes(format(zlib.crc32(text.value) & 0xFFFFFFFF, "08x").encode())
         )
 
+    @set_args(["value"])
+    def execute_hash_fp(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        return RTResult().success(Number(hash(value)))
+
     @set_args(["text", "substring"])
     def execute_find_fp(self, exec_ctx):
         text = exec_ctx.symbol_table.get("text")
@@ -2139,140 +3712,413 @@ class BuiltInFunction(BaseFunction):
             return RTResult().success(Number.none)
         return RTResult().success(Number(index))
 
-    def _handle_panic_result(self, res, exec_ctx):
-        if res.error:
-            err = res.error
-            if isinstance(err, RTError):
-                err_str = str(err)
-                err_line = err_str.strip().split("\n")[-1]
-                err_name, err_msg = err_line.split(":", 1)
-                err_name, err_msg = err_name.strip(), err_msg.strip()
-
-                if "Runtime" in err_name:
-                    err_name_short = "RT"
-                elif "Math" in err_name:
-                    err_name_short = "M"
-                elif "IO" in err_name:
-                    err_name_short = "IO"
-                elif "Type" in err_name:
-                    err_name_short = "T"
-                else:
-                    err_name_short = "UNKNOWN"
+    @set_args(["text", "kind", "whole"], [None, None, Bool.false])
+    def execute_string_is_fp(self, exec_ctx):
+        text = exec_ctx.symbol_table.get("text")
+        chars = STRING_CLASSES[exec_ctx.symbol_table.get("kind").value]
+        whole = exec_ctx.symbol_table.get("whole")
+        if not isinstance(text, String) or not text.value:
+            return RTResult().success(Bool.false)
+        if len(text.value) != 1 and not whole.is_true():
+            return RTResult().success(Bool.false)
+        return RTResult().success(Bool(not text.value.strip(chars)))
 
-                return RTResult().success(
-                    List([Number.none, String(err_msg), String(err_name_short)])
+    @set_args(["text", "substring"])
+    def execute_string_find_all_fp(self, exec_ctx):
+        text = exec_ctx.symbol_table.get("text")
+        substring = exec_ctx.symbol_table.get("substring")
+        if not isinstance(text, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'find_all' must be a string",
+                    exec_ctx,
                 )
-            else:
-                return RTResult().failure(err)
-        else:
-            return RTResult().success(List([res.value, Number.none, Number.none]))
-
-    @set_args(["func", "args", "kwargs"], [None, List([]), HashMap({})])
-    def execute_is_panic(self, exec_ctx):
-        func = exec_ctx.symbol_table.get("func")
-        args = exec_ctx.symbol_table.get("args")
-        kwargs = exec_ctx.symbol_table.get("kwargs")
-
-        if not isinstance(func, BaseFunction):
+            )
+        if not isinstance(substring, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'is_panic' must be a function",
+                    "Second argument of 'find_all' must be a string",
                     exec_ctx,
                 )
             )
-        if not isinstance(args, List):
+        haystack, needle = text.value, substring.value
+        result = []
+        if needle:
+            index = haystack.find(needle)
+            while index != -1:
+                result.append(Number(index))
+                index = haystack.find(needle, index + 1)
+        return RTResult().success(List(result))
+
+    def _string_affix(self, exec_ctx, fn_name, check):
+        text = exec_ctx.symbol_table.get("text")
+        affix = exec_ctx.symbol_table.get("affix")
+        if not isinstance(text, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'is_panic' must be a list",
+                    f"First argument of '{fn_name}' must be a string",
                     exec_ctx,
                 )
             )
-        if not isinstance(kwargs, HashMap):
+        if not isinstance(affix, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Third argument of 'is_panic' must be a hashmap",
+                    f"Second argument of '{fn_name}' must be a string",
                     exec_ctx,
                 )
             )
+        if not text.value or not affix.value:
+            return RTResult().success(Bool.false)
+        return RTResult().success(Bool(check(text.value, affix.value)))
 
-        try:
-            positional_args = args.value
-            keyword_args = kwargs.value
-
-            res = func.execute(positional_args, keyword_args)
+    @set_args(["text", "affix"])
+    def execute_string_startswith_fp(self, exec_ctx):
+        return self._string_affix(exec_ctx, "startswith", str.startswith)
 
-            return self._handle_panic_result(res, exec_ctx)
+    @set_args(["text", "affix"])
+    def execute_string_endswith_fp(self, exec_ctx):
+        return self._string_affix(exec_ctx, "endswith", str.endswith)
 
-        except Exception as err:
+    @set_args(["initial"], [String("")])
+    def execute_string_builder_fp(self, exec_ctx):
+        initial = exec_ctx.symbol_table.get("initial")
+        if not isinstance(initial, String):
             return RTResult().failure(
-                RTError(
+                TError(
                     self.pos_start,
                     self.pos_end,
-                    f"Unexpected Python error in 'is_panic': {err}",
+                    "First argument of 'builder' must be a string",
                     exec_ctx,
                 )
             )
+        return RTResult().success(
+            StringBuilder([initial.value] if initial.value else None)
+        )
 
-    @set_args(["path"])
-    def execute_is_file_fp(self, exec_ctx):
-        path = exec_ctx.symbol_table.get("path")
-        if not isinstance(path, String):
+    def _get_string_builder(self, exec_ctx, fn_name):
+        builder = exec_ctx.symbol_table.get("builder")
+        if not isinstance(builder, StringBuilder):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a string builder",
+                exec_ctx,
+            )
+        return builder, None
+
+    @set_args(["builder", "text"])
+    def execute_string_builder_append_fp(self, exec_ctx):
+        builder, error = self._get_string_builder(exec_ctx, "append")
+        if error:
+            return RTResult().failure(error)
+        text = exec_ctx.symbol_table.get("text")
+        if not isinstance(text, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'is_file' must be a string",
+                    "Second argument of 'append' must be a string",
                     exec_ctx,
                 )
             )
-        return RTResult().success(
-            Number.true if os.path.isfile(path.value) else Number.false
-        )
+        builder.append(text.value)
+        return RTResult().success(builder)
 
-    @set_args(["a"])
-    def execute_sqrt_fp(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        try:
-            return RTResult().success(Number(math.sqrt(a.value)))
-        except ValueError:
-            RTResult().failure(
-                MError(
+    @set_args(["builder", "items", "sep"], [None, None, String("")])
+    def execute_string_builder_append_many_fp(self, exec_ctx):
+        builder, error = self._get_string_builder(exec_ctx, "append_many")
+        if error:
+            return RTResult().failure(error)
+        items = exec_ctx.symbol_table.get("items")
+        sep = exec_ctx.symbol_table.get("sep")
+        if not isinstance(items, List | Iterator):
+            return RTResult().failure(
+                TError(
                     self.pos_start,
                     self.pos_end,
-                    "Math domain error",
-                    self.context,
+                    "Second argument of 'append_many' must be a list or an iterator",
+                    exec_ctx,
                 )
             )
+        if not isinstance(sep, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'append_many' must be a string",
+                    exec_ctx,
+                )
+            )
+        source, _ = items.iter()
+        texts = []
+        try:
+            for item in source:
+                if not isinstance(item, String):
+                    return RTResult().failure(
+                        TError(
+                            self.pos_start,
+                            self.pos_end,
+                            "Items passed to 'append_many' must be strings",
+                            exec_ctx,
+                        )
+                    )
+                texts.append(item.value)
+        except IterError as e:
+            return RTResult().failure(
+                RTError(self.pos_start, self.pos_end, e.message, exec_ctx)
+            )
+        if sep.value:
+            if texts:
+                builder.append(sep.value.join(texts))
+        else:
+            for text in texts:
+                builder.append(text)
+        return RTResult().success(builder)
 
-    @set_args(["a"])
-    def execute_abs_fp(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        return RTResult().success(Number(abs(a.value)))
-
-    @set_args(["x"])
-    def execute_sin_fp(self, exec_ctx):
-        x = exec_ctx.symbol_table.get("x")
-        return RTResult().success(Number(math.sin(x.value)))
+    @set_args(["builder"])
+    def execute_string_builder_build_fp(self, exec_ctx):
+        builder, error = self._get_string_builder(exec_ctx, "build")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(String(builder.build()))
 
-    @set_args(["x"])
-    def execute_cos_fp(self, exec_ctx):
-        x = exec_ctx.symbol_table.get("x")
-        return RTResult().success(Number(math.cos(x.value)))
+    @set_args(["builder"])
+    def execute_string_builder_clear_fp(self, exec_ctx):
+        builder, error = self._get_string_builder(exec_ctx, "clear")
+        if error:
+            return RTResult().failure(error)
+        builder.parts = []
+        builder.length = 0
+        return RTResult().success(builder)
+
+    def _get_set(self, exec_ctx, fn_name):
+        set_ = exec_ctx.symbol_table.get("set")
+        if not isinstance(set_, Set):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a set",
+                exec_ctx,
+            )
+        return set_, None
+
+    def _set_items(self, exec_ctx, fn_name, name, position):
+        items = exec_ctx.symbol_table.get(name)
+        if isinstance(items, Set):
+            return items, None
+        if not isinstance(items, List | Iterator):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"{position} argument of '{fn_name}' must be a set, list or iterator",
+                exec_ctx,
+            )
+        source, _ = items.iter()
+        result = Set()
+        try:
+            result.update(source)
+        except IterError as e:
+            return None, RTError(self.pos_start, self.pos_end, e.message, exec_ctx)
+        return result, None
+
+    @set_args(["items"], [Number.none])
+    def execute_set_fp(self, exec_ctx):
+        items = exec_ctx.symbol_table.get("items")
+        if isinstance(items, NoneObject):
+            return RTResult().success(Set())
+        if isinstance(items, Set):
+            return RTResult().success(items.copy())
+        items, error = self._set_items(exec_ctx, "new", "items", "First")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(items)
 
-    @set_args(["x"])
-    def execute_tan_fp(self, exec_ctx):
-        x = exec_ctx.symbol_table.get("x")
-        return RTResult().success(Number(math.tan(x.value)))
+    @set_args(["set", "value"])
+    def execute_set_add_fp(self, exec_ctx):
+        set_, error = self._get_set(exec_ctx, "add")
+        if error:
+            return RTResult().failure(error)
+        set_.add(exec_ctx.symbol_table.get("value"))
+        return RTResult().success(Number.none)
 
-    @set_args(["n"])
-    def execute_fact_fp(self, exec_ctx):
-        n = exec_ctx.symbol_table.get("n")
+    @set_args(["set", "value"])
+    def execute_set_remove_fp(self, exec_ctx):
+        set_, error = self._get_set(exec_ctx, "remove")
+        if error:
+            return RTResult().failure(error)
+        if not set_.remove(exec_ctx.symbol_table.get("value")):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Value not found in set",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number.none)
+
+    @set_args(["set", "value"])
+    def execute_set_contains_fp(self, exec_ctx):
+        set_, error = self._get_set(exec_ctx, "contains")
+        if error:
+            return RTResult().failure(error)
+        value = exec_ctx.symbol_table.get("value")
+        return RTResult().success(Bool(set_.contains(value)))
+
+    def _set_operation(self, exec_ctx, fn_name, operation):
+        set_, error = self._get_set(exec_ctx, fn_name)
+        if error:
+            return RTResult().failure(error)
+        other, error = self._set_items(exec_ctx, fn_name, "other", "Second")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(operation(set_, other))
+
+    @set_args(["set", "other"])
+    def execute_set_union_fp(self, exec_ctx):
+        return self._set_operation(exec_ctx, "union", Set.union)
+
+    @set_args(["set", "other"])
+    def execute_set_intersection_fp(self, exec_ctx):
+        return self._set_operation(exec_ctx, "intersection", Set.intersection)
+
+    @set_args(["set", "other"])
+    def execute_set_difference_fp(self, exec_ctx):
+        return self._set_operation(exec_ctx, "difference", Set.difference)
+
+    @set_args(["set"])
+    def execute_set_to_list_fp(self, exec_ctx):
+        set_, error = self._get_set(exec_ctx, "to_list")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(List(set_.items()))
+
+    def _handle_panic_result(self, res, exec_ctx):
+        if res.error:
+            err = res.error
+            if isinstance(err, RTError):
+                return RTResult().success(
+                    List([Number.none, String(str(err.details)), String(err.kind)])
+                )
+            else:
+                return RTResult().failure(err)
+        else:
+            return RTResult().success(List([res.value, Number.none, Number.none]))
+
+    @set_args(["func", "args", "kwargs"], [None, List([]), HashMap({})])
+    def execute_is_panic(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+        args = exec_ctx.symbol_table.get("args")
+        kwargs = exec_ctx.symbol_table.get("kwargs")
+
+        if not isinstance(func, BaseFunction):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'is_panic' must be a function",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(args, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'is_panic' must be a list",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(kwargs, HashMap):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'is_panic' must be a hashmap",
+                    exec_ctx,
+                )
+            )
+
+        try:
+            positional_args = args.value
+            keyword_args = kwargs.value
+
+            res = func.execute(positional_args, keyword_args)
+
+            return self._handle_panic_result(res, exec_ctx)
+
+        except Exception as err:
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Unexpected Python error in 'is_panic': {err}",
+                    exec_ctx,
+                )
+            )
+
+    @set_args(["path"])
+    def execute_is_file_fp(self, exec_ctx):
+        path = exec_ctx.symbol_table.get("path")
+        if not isinstance(path, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'is_file' must be a string",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(
+            Number.true if os.path.isfile(path.value) else Number.false
+        )
+
+    @set_args(["a"])
+    def execute_sqrt_fp(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        try:
+            return RTResult().success(Number(math.sqrt(a.value)))
+        except ValueError:
+            RTResult().failure(
+                MError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Math domain error",
+                    self.context,
+                )
+            )
+
+    @set_args(["a"])
+    def execute_abs_fp(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        return RTResult().success(Number(abs(a.value)))
+
+    @set_args(["x"])
+    def execute_sin_fp(self, exec_ctx):
+        x = exec_ctx.symbol_table.get("x")
+        return RTResult().success(Number(math.sin(x.value)))
+
+    @set_args(["x"])
+    def execute_cos_fp(self, exec_ctx):
+        x = exec_ctx.symbol_table.get("x")
+        return RTResult().success(Number(math.cos(x.value)))
+
+    @set_args(["x"])
+    def execute_tan_fp(self, exec_ctx):
+        x = exec_ctx.symbol_table.get("x")
+        return RTResult().success(Number(math.tan(x.value)))
+
+    @set_args(["n"])
+    def execute_fact_fp(self, exec_ctx):
+        n = exec_ctx.symbol_table.get("n")
         return RTResult().success(Number(math.factorial(n.value)))
 
     @set_args(["a", "b"])
@@ -2372,7 +4218,7 @@ class BuiltInFunction(BaseFunction):
         elif isinstance(obj, PyObject):
             return obj.get_obj()
         elif isinstance(obj, Bytes):
-            return obj.value
+            return bytes(obj.value)
         else:
             return str(obj)
 
@@ -3848,7 +5694,7 @@ class BuiltInFunction(BaseFunction):
                 )
             )
         try:
-            decoded = s.value.decode(encoding.value, errors.value)
+            decoded = bytes(s.value).decode(encoding.value, errors.value)
             return RTResult().success(String(decoded))
         except Exception as e:
             return RTResult().failure(
@@ -3948,8 +5794,7 @@ class BuiltInFunction(BaseFunction):
                 )
             )
         try:
-            parsed = json.loads(value.value)
-            return RTResult().success(self.validate_pyexec_result(parsed))
+            return RTResult().success(json_value(JSON_DECODER.decode(value.value)))
         except json.JSONDecodeError as e:
             return RTResult().failure(
                 RTError(
@@ -3964,9 +5809,8 @@ class BuiltInFunction(BaseFunction):
     def execute_stringify_fp(self, exec_ctx):
         value = exec_ctx.symbol_table.get("value")
         try:
-            stringified = json.dumps(self.convert_zer_to_py(value))
-            return RTResult().success(String(stringified))
-        except (TypeError, OverflowError) as e:
+            return RTResult().success(String(JSON_ENCODER.encode(value)))
+        except (TypeError, ValueError, OverflowError) as e:
             return RTResult().failure(
                 RTError(
                     self.pos_start,
@@ -3976,431 +5820,1849 @@ class BuiltInFunction(BaseFunction):
                 )
             )
 
-    @set_args(["channel", "value"])
-    def execute_channel_send_fp(self, exec_ctx):
-        channel = exec_ctx.symbol_table.get("channel")
-        value = exec_ctx.symbol_table.get("value")
-        if not isinstance(channel, Channel):
+    def _open_path(self, exec_ctx, fn_name, mode):
+        file_path = exec_ctx.symbol_table.get("file_path")
+        if not isinstance(file_path, String):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a string",
+                exec_ctx,
+            )
+        try:
+            encoding = None if "b" in mode else "utf-8"
+            return open(file_path.value, mode, encoding=encoding), None
+        except FileNotFoundError:
+            return None, IError(
+                self.pos_start,
+                self.pos_end,
+                f"File not found: '{file_path.value}'",
+                exec_ctx,
+            )
+        except Exception as e:
+            return None, IError(
+                self.pos_start,
+                self.pos_end,
+                f"Error opening file: {e}",
+                exec_ctx,
+            )
+
+    @set_args(["file_path"])
+    def execute_json_read_fp(self, exec_ctx):
+        handle, error = self._open_path(exec_ctx, "read", "r")
+        if error:
+            return RTResult().failure(error)
+        try:
+            with handle:
+                parsed = JSON_DECODER.decode(handle.read())
+            return RTResult().success(json_value(parsed))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'send' must be a channel",
+                    f"Failed to parse JSON: {e}",
                     exec_ctx,
                 )
             )
 
-        channel.queue.put(value)
-        return RTResult().success(Number.none)
-
-    @set_args(["channel"])
-    def execute_channel_receive_fp(self, exec_ctx):
-        channel = exec_ctx.symbol_table.get("channel")
-        if not isinstance(channel, Channel):
+    @set_args(["file_path", "value"])
+    def execute_json_write_fp(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        try:
+            text = JSON_ENCODER.encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'receive' must be a channel",
+                    f"Failed to stringify to JSON: {e}",
                     exec_ctx,
                 )
             )
-
+        handle, error = self._open_path(exec_ctx, "write", "w")
+        if error:
+            return RTResult().failure(error)
         try:
-            value = channel.queue.get()
-            return RTResult().success(value)
+            with handle:
+                handle.write(text)
         except Exception as e:
             return RTResult().failure(
-                RTError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    f"Error receiving from channel: {e}",
+                    f"Error writing JSON file: {e}",
                     exec_ctx,
                 )
             )
+        return RTResult().success(Number.none)
 
-    @set_args(["channel"])
-    def execute_channel_is_empty_fp(self, exec_ctx):
-        channel = exec_ctx.symbol_table.get("channel")
-        if not isinstance(channel, Channel):
+    def _path_or_file(self, exec_ctx, fn_name, mode):
+        file = exec_ctx.symbol_table.get("file_path")
+        if isinstance(file, File) and file.handle is not None:
+            if file.handle.closed:
+                return (
+                    None,
+                    None,
+                    IError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"Cannot '{fn_name}' a closed file",
+                        exec_ctx,
+                    ),
+                )
+            return file.handle, file.path, None
+        if not isinstance(file, String):
+            return (
+                None,
+                None,
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"First argument of '{fn_name}' must be a string or a file opened with 'ffio.open'",
+                    exec_ctx,
+                ),
+            )
+        handle, error = self._open_path(exec_ctx, fn_name, mode)
+        return handle, file.value, error
+
+    @set_args(["file_path", "batch_size"], [None, Number(0)])
+    def execute_json_iter_lines_fp(self, exec_ctx):
+        batch_size = exec_ctx.symbol_table.get("batch_size")
+        if not isinstance(batch_size, Number) or batch_size.value < 0:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'is_empty' must be a channel",
+                    "Batch size must be a non-negative number",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Bool(channel.queue.empty()))
-
-    @set_args([])
-    def execute_channel_new_fp(self, _):
-        channel = Channel(PyQueue())
-        return RTResult().success(channel)
-
-    @set_args(
-        ["value1", "value2", "rel_tol", "abs_tol"],
-        [None, None, Number(1e-9), Number(0.0)],
-    )
-    def execute_is_close_fp(self, exec_ctx):
-        v1 = exec_ctx.symbol_table.get("value1").value
-        v2 = exec_ctx.symbol_table.get("value2").value
-        rel_tol = exec_ctx.symbol_table.get("rel_tol").value
-        abs_tol = exec_ctx.symbol_table.get("abs_tol").value
+        handle, path, error = self._path_or_file(exec_ctx, "iter_lines", "r")
+        if error:
+            return RTResult().failure(error)
+        owned = isinstance(exec_ctx.symbol_table.get("file_path"), String)
+        lines = iter_json_lines(handle, path, int(batch_size.value), owned)
+        return RTResult().success(Iterator(lines, path))
 
-        return RTResult().success(
-            Bool(math.isclose(v1, v2, rel_tol=rel_tol, abs_tol=abs_tol))
+    @set_args(["file_path", "items", "append"], [None, None, Bool.false])
+    def execute_json_write_lines_fp(self, exec_ctx):
+        items = exec_ctx.symbol_table.get("items")
+        append = exec_ctx.symbol_table.get("append")
+        if not isinstance(items, List | Iterator):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'write_lines' must be a list or an iterator",
+                    exec_ctx,
+                )
+            )
+        handle, path, error = self._path_or_file(
+            exec_ctx, "write_lines", "a" if append.is_true() else "w"
         )
-
-    @set_args(["value"])
-    def execute_is_channel(self, exec_ctx):
-        is_channel = isinstance(exec_ctx.symbol_table.get("value"), Channel)
-        return RTResult().success(Number.true if is_channel else Number.false)
-
-    @set_args(["value"])
-    def execute_is_cfloat(self, exec_ctx):
-        is_cfloat = isinstance(exec_ctx.symbol_table.get("value"), CFloat)
-        return RTResult().success(Number.true if is_cfloat else Number.false)
-
-    @set_args(["value", "supress_error"], [None, Bool.false])
-    def execute_to_cfloat(self, exec_ctx):
-        value = exec_ctx.symbol_table.get("value")
-        supress_error = exec_ctx.symbol_table.get("supress_error")
-
-        if not isinstance(supress_error, Bool):
+        if error:
+            return RTResult().failure(error)
+        owned = isinstance(exec_ctx.symbol_table.get("file_path"), String)
+        binary = "b" in handle.mode
+        encode = JSON_ENCODER.encode
+        source, _ = items.iter()
+        count = 0
+        try:
+            for item in source:
+                line = encode(item) + "\n"
+                handle.write(line.encode("utf-8") if binary else line)
+                count += 1
+        except IterError as e:
+            return RTResult().failure(
+                RTError(self.pos_start, self.pos_end, e.message, exec_ctx)
+            )
+        except (TypeError, ValueError, OverflowError) as e:
             return RTResult().failure(
                 RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'to_cfloat' must be a boolean",
+                    f"Failed to stringify to JSON: {e}",
                     exec_ctx,
                 )
             )
+        except OSError as e:
+            return RTResult().failure(
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to write to file "{path}": {e}',
+                    exec_ctx,
+                )
+            )
+        finally:
+            if owned:
+                handle.close()
+        return RTResult().success(Number(count))
 
-        supress_error_ = bool(supress_error.value)
-
-        try:
-            if isinstance(value, CFloat):
-                result = CFloat(value.value)
-                return RTResult().success(result)
-
-            elif isinstance(value, Number):
-                decimal_value = Fraction(str(value.value))
-                result = CFloat(decimal_value)
-                return RTResult().success(result)
-
-            elif isinstance(value, String):
-                try:
-                    decimal_value = Fraction(value.value)
-                except ZeroDivisionError:
-                    return RTResult().failure(
-                        RTError(
-                            self.pos_start,
-                            self.pos_end,
-                            "Division by zero",
-                            exec_ctx,
-                        )
-                    )
-                result = CFloat(decimal_value)
-                return RTResult().success(result)
-
-            else:
-                if supress_error_:
-                    result = CFloat(Fraction("0"))
-                    return RTResult().success(result)
-                else:
-                    return RTResult().failure(
-                        RTError(
-                            self.pos_start,
-                            self.pos_end,
-                            f"Can't convert '{value.type()}' to decimal",
-                            exec_ctx,
-                        )
-                    )
-
-        except (ValueError, TypeError) as e:
-            if supress_error_:
-                result = CFloat(Fraction("0"))
-                return RTResult().success(result)
-            else:
-                return RTResult().failure(
-                    RTError(
-                        self.pos_start,
-                        self.pos_end,
-                        f"Failed to convert to decimal: {str(e)}",
-                        exec_ctx,
-                    )
-                )
-
-    @set_args(["max_workers"], [Number(5)])
-    def execute_thread_pool_new_fp(self, exec_ctx):
-        max_workers = exec_ctx.symbol_table.get("max_workers")
-        if not isinstance(max_workers, Number):
+    @set_args(["file_path", "batch_size"], [None, Number(0)])
+    def execute_json_items_fp(self, exec_ctx):
+        batch_size = exec_ctx.symbol_table.get("batch_size")
+        if not isinstance(batch_size, Number) or batch_size.value < 0:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'new' must be a number",
+                    "Batch size must be a non-negative number",
                     exec_ctx,
                 )
             )
-        return RTResult().success(ThreadPool(max_workers.value))
-
-    @set_args(["pool", "func", "args", "kwargs"], [None, None, List([]), HashMap({})])
-    def execute_thread_pool_submit_fp(self, exec_ctx):
-        pool = exec_ctx.symbol_table.get("pool")
-        func = exec_ctx.symbol_table.get("func")
-        args = exec_ctx.symbol_table.get("args")
-        kwargs = exec_ctx.symbol_table.get("kwargs")
+        handle, error = self._open_path(exec_ctx, "items", "r")
+        if error:
+            return RTResult().failure(error)
+        path = exec_ctx.symbol_table.get("file_path").value
+        return RTResult().success(
+            Iterator(iter_json_items(handle, path, int(batch_size.value)), path)
+        )
 
-        if not isinstance(pool, ThreadPool):
+    @set_args(["value"])
+    def execute_binary_pack_fp(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        try:
+            return RTResult().success(Bytes(pack_frame(value)))
+        except TypeError as e:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'submit' must be a thread pool",
+                    f"Value of type '{e}' cannot be packed",
                     exec_ctx,
                 )
             )
-        if not isinstance(func, BaseFunction):
+
+    def _unpack_frames(self, exec_ctx, fn_name, many):
+        data = exec_ctx.symbol_table.get("data")
+        if not isinstance(data, Bytes):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'submit' must be a function",
+                    f"First argument of '{fn_name}' must be bytes",
                     exec_ctx,
                 )
             )
-        if not isinstance(args, List):
+        view = memoryview(data.value)
+        values = []
+        pos = 0
+        try:
+            while True:
+                value, pos = unpack_frame(view, pos)
+                values.append(value)
+                if pos == len(view) or not many:
+                    break
+        except (ValueError, EOFError, TypeError) as e:
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Third argument of 'submit' must be a list",
+                    f"Failed to unpack: {e}",
                     exec_ctx,
                 )
             )
-        if not isinstance(kwargs, HashMap):
+        if many:
+            return RTResult().success(List(values))
+        if pos != len(view):
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Fourth argument of 'submit' must be a hashmap",
+                    "Failed to unpack: data holds more than one frame",
                     exec_ctx,
                 )
             )
+        return RTResult().success(values[0])
 
-        positional_args = args.value
-        keyword_args = {
-            k.value: v for k, v in kwargs.value.items() if hasattr(k, "value")
-        }
-
-        def task_wrapper():
-            res = func.execute(positional_args, keyword_args)
-
-            if res.error:
-                raise ThreadPoolError(res.error)
-            return res.value
+    @set_args(["data"])
+    def execute_binary_unpack_fp(self, exec_ctx):
+        return self._unpack_frames(exec_ctx, "unpack", False)
 
-        future = pool.executor.submit(task_wrapper)
-        return RTResult().success(Future(future))
+    @set_args(["data"])
+    def execute_binary_unpack_all_fp(self, exec_ctx):
+        return self._unpack_frames(exec_ctx, "unpack_all", True)
 
-    @set_args(["pool", "wait"], [None, Bool.true])
-    def execute_thread_pool_shutdown_fp(self, exec_ctx):
-        pool = exec_ctx.symbol_table.get("pool")
-        wait = exec_ctx.symbol_table.get("wait")
+    def _get_binary_file(self, exec_ctx, fn_name):
+        file, error = self._get_open_file(exec_ctx, fn_name)
+        if error:
+            return None, error
+        if not file.is_binary():
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"'{fn_name}' needs a file opened in binary mode, not '{file.handle.mode}'",
+                exec_ctx,
+            )
+        return file, None
 
-        if not isinstance(pool, ThreadPool):
+    @set_args(["file", "value"])
+    def execute_binary_write_fp(self, exec_ctx):
+        file, error = self._get_binary_file(exec_ctx, "write")
+        if error:
+            return RTResult().failure(error)
+        value = exec_ctx.symbol_table.get("value")
+        try:
+            file.handle.write(pack_frame(value))
+        except TypeError as e:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'shutdown' must be a thread pool",
+                    f"Value of type '{e}' cannot be packed",
                     exec_ctx,
                 )
             )
-        if not isinstance(wait, Bool):
+        except Exception as e:
             return RTResult().failure(
-                TError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'shutdown' must be a boolean",
+                    f'Failed to write to file "{file.path}": ' + str(e),
                     exec_ctx,
                 )
             )
-
-        pool.executor.shutdown(wait=wait.value)
         return RTResult().success(Number.none)
 
-    @set_args(["future"])
-    def execute_future_result_fp(self, exec_ctx):
-        future_obj = exec_ctx.symbol_table.get("future")
-        if not isinstance(future_obj, Future):
+    @set_args(["file"])
+    def execute_binary_read_fp(self, exec_ctx):
+        file, error = self._get_binary_file(exec_ctx, "read")
+        if error:
+            return RTResult().failure(error)
+        try:
+            value = read_frame(file.handle)
+        except (ValueError, EOFError, TypeError) as e:
             return RTResult().failure(
-                TError(
-                    self.pos_start, self.pos_end, "Argument must be a future", exec_ctx
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f'Failed to unpack "{file.path}": {e}',
+                    exec_ctx,
                 )
             )
+        return RTResult().success(Number.none if value is None else value)
 
-        try:
-            result = future_obj.future.result()
-            return RTResult().success(result)
-        except ThreadPoolError as e:
-            return RTResult().failure(e.err)
-        except Exception as err:
+    @set_args(["file_path"])
+    def execute_binary_frames_fp(self, exec_ctx):
+        handle, path, error = self._path_or_file(exec_ctx, "frames", "rb")
+        if error:
+            return RTResult().failure(error)
+        if "b" not in handle.mode:
             return RTResult().failure(
-                RTError(
+                TError(
                     self.pos_start,
                     self.pos_end,
-                    f"Unexpected Python error in 'result': {err}",
+                    f"'frames' needs a file opened in binary mode, not '{handle.mode}'",
                     exec_ctx,
                 )
             )
+        owned = isinstance(exec_ctx.symbol_table.get("file_path"), String)
+        return RTResult().success(Iterator(iter_frames(handle, path, owned), path))
 
-    @set_args(["future"])
-    def execute_future_done_fp(self, exec_ctx):
-        future_obj = exec_ctx.symbol_table.get("future")
-        if not isinstance(future_obj, Future):
+    @set_args(["func", "maxsize", "ttl"], [None, Number(128), Number.none])
+    def execute_memoize_fp(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+        maxsize = exec_ctx.symbol_table.get("maxsize")
+        ttl = exec_ctx.symbol_table.get("ttl")
+        if not isinstance(func, BaseFunction):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'is_done' must be a future",
+                    "First argument of 'memoize' must be a function",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Bool(future_obj.future.done()))
-
-    @set_args(["message", "title"])
-    def execute_msgbox_alert_fp(self, exec_ctx):
-        msg = exec_ctx.symbol_table.get("message")
-        title = exec_ctx.symbol_table.get("title")
-
-        if not isinstance(msg, String):
+        if not isinstance(maxsize, NoneObject) and (
+            not isinstance(maxsize, Number) or maxsize.value < 1
+        ):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'alert' must be a string",
+                    "'maxsize' of 'memoize' must be a positive number or none",
                     exec_ctx,
                 )
             )
-        if not isinstance(title, String):
+        if not isinstance(ttl, NoneObject) and (
+            not isinstance(ttl, Number) or ttl.value <= 0
+        ):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'alert' must be a string",
+                    "'ttl' of 'memoize' must be a positive number of seconds or none",
                     exec_ctx,
                 )
             )
+        return RTResult().success(
+            MemoizedFunction(
+                func,
+                None if isinstance(maxsize, NoneObject) else int(maxsize.value),
+                None if isinstance(ttl, NoneObject) else ttl.value,
+            )
+        )
 
-        try:
-            import pyautogui  # type: ignore
-
-            result = pyautogui.alert(str(msg.value), str(title.value))
-            return RTResult().success(Number.none)
-        except Exception as e:
-            return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+    def _get_memoized(self, exec_ctx, fn_name):
+        func = exec_ctx.symbol_table.get("func")
+        if not isinstance(func, MemoizedFunction):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a memoized function",
+                exec_ctx,
             )
+        return func, None
 
-    @set_args(
-        ["message", "title", "buttons"],
-        [None, None, List([String("Ok"), String("Cancel")])],
-    )
-    def execute_msgbox_confirm_fp(self, exec_ctx):
-        msg = exec_ctx.symbol_table.get("message")
-        title = exec_ctx.symbol_table.get("title")
-        buttons = exec_ctx.symbol_table.get("buttons")
+    @set_args(["func"])
+    def execute_cache_info_fp(self, exec_ctx):
+        func, error = self._get_memoized(exec_ctx, "cache_info")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(func.info())
 
-        if not isinstance(msg, String):
+    @set_args(["func"])
+    def execute_cache_clear_fp(self, exec_ctx):
+        func, error = self._get_memoized(exec_ctx, "cache_clear")
+        if error:
+            return RTResult().failure(error)
+        func.clear()
+        return RTResult().success(Number.none)
+
+    def _get_timeout(self, exec_ctx, fn_name, position):
+        timeout = exec_ctx.symbol_table.get("timeout")
+        if isinstance(timeout, NoneObject):
+            return None, None
+        if not isinstance(timeout, Number):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"{position} argument of '{fn_name}' must be a number or none",
+                exec_ctx,
+            )
+        return max(timeout.value, 0), None
+
+    @set_args(["channel", "value", "timeout"], [None, None, Number.none])
+    def execute_channel_send_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        value = exec_ctx.symbol_table.get("value")
+        if not isinstance(channel, Channel):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'confirm' must be a string",
+                    "First argument of 'send' must be a channel",
                     exec_ctx,
                 )
             )
-        if not isinstance(title, String):
+        timeout, error = self._get_timeout(exec_ctx, "send", "Third")
+        if error:
+            return RTResult().failure(error)
+
+        status = channel.send(value, timeout)
+        if status == "closed":
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'confirm' must be a string",
+                    "Cannot send on a closed channel",
                     exec_ctx,
                 )
             )
-        if not isinstance(buttons, List):
+        if status == "timeout":
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Third argument of 'confirm' must be a list",
+                    "Timed out sending to channel",
                     exec_ctx,
                 )
             )
+        return RTResult().success(Number.none)
 
-        try:
-            import pyautogui  # type: ignore
-
-            result = pyautogui.confirm(
-                str(msg.value),
-                str(title.value),
-                [str(b.value) for b in buttons.elements if isinstance(b, String)],
-            )
-            return RTResult().success(String(result if result else Number.none))
-        except Exception as e:
-            return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
-            )
-
-    @set_args(["message", "title"])
-    def execute_msgbox_prompt_fp(self, exec_ctx):
-        msg = exec_ctx.symbol_table.get("message")
-        title = exec_ctx.symbol_table.get("title")
-
-        if not isinstance(msg, String):
+    @set_args(["channel", "timeout"], [None, Number.none])
+    def execute_channel_receive_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        if not isinstance(channel, Channel):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'prompt' must be a string",
+                    "First argument of 'receive' must be a channel",
                     exec_ctx,
                 )
             )
-        if not isinstance(title, String):
+        timeout, error = self._get_timeout(exec_ctx, "receive", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        status, value = channel.recv(timeout)
+        if status == "timeout":
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'prompt' must be a string",
+                    "Timed out receiving from channel",
                     exec_ctx,
                 )
             )
+        if status == "closed":
+            return RTResult().success(Number.none)
+        return RTResult().success(value)
 
-        try:
-            import pyautogui  # type: ignore
-
-            result = pyautogui.prompt(str(msg.value), str(title.value))
-            return RTResult().success(String(result if result else Number.none))
-        except Exception as e:
-            return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
-            )
-
-    @set_args(["message", "title"])
-    def execute_msgbox_password_fp(self, exec_ctx):
-        msg = exec_ctx.symbol_table.get("message")
-        title = exec_ctx.symbol_table.get("title")
-
-        if not isinstance(msg, String):
+    @set_args(["channel", "values", "timeout"], [None, None, Number.none])
+    def execute_channel_send_many_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        values = exec_ctx.symbol_table.get("values")
+        if not isinstance(channel, Channel):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'password' must be a string",
+                    "First argument of 'send_many' must be a channel",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(values, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'send_many' must be a list",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "send_many", "Third")
+        if error:
+            return RTResult().failure(error)
+
+        _, sent = channel.send_many(values.value, timeout)
+        return RTResult().success(Number(sent))
+
+    @set_args(["channel", "max_items", "timeout"], [None, Number(0), Number.none])
+    def execute_channel_receive_many_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        max_items = exec_ctx.symbol_table.get("max_items")
+        if not isinstance(channel, Channel):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'recv_many' must be a channel",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(max_items, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'recv_many' must be a number",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "recv_many", "Third")
+        if error:
+            return RTResult().failure(error)
+
+        _, values = channel.recv_many(int(max_items.value), timeout)
+        return RTResult().success(List(values))
+
+    @set_args(["channel", "value"])
+    def execute_channel_try_send_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        value = exec_ctx.symbol_table.get("value")
+        if not isinstance(channel, Channel):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'try_send' must be a channel",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bool(channel.send(value, 0) == "ok"))
+
+    @set_args(["channel"])
+    def execute_channel_try_receive_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        if not isinstance(channel, Channel):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'try_recv' must be a channel",
+                    exec_ctx,
+                )
+            )
+        status, value = channel.recv(0)
+        if status != "ok":
+            return RTResult().success(List([Number.none, Number.false]))
+        return RTResult().success(List([value, Number.true]))
+
+    @set_args(["channels", "timeout"], [None, Number.none])
+    def execute_channel_select_fp(self, exec_ctx):
+        channels = exec_ctx.symbol_table.get("channels")
+        if not isinstance(channels, List) or not all(
+            isinstance(ch, Channel) for ch in channels.value
+        ):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'select' must be a list of channels",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "select", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        index, value = select_channels(channels.value, timeout)
+        if index == -1:
+            return RTResult().success(List([Number(-1), Number.none]))
+        return RTResult().success(List([Number(index), value]))
+
+    @set_args(["channel"])
+    def execute_channel_close_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        if not isinstance(channel, Channel):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'close' must be a channel",
+                    exec_ctx,
+                )
+            )
+        channel.close()
+        return RTResult().success(Number.none)
+
+    @set_args(["channel"])
+    def execute_channel_is_closed_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        if not isinstance(channel, Channel):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'is_closed' must be a channel",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bool(channel.closed))
+
+    @set_args(["channel"])
+    def execute_channel_is_empty_fp(self, exec_ctx):
+        channel = exec_ctx.symbol_table.get("channel")
+        if not isinstance(channel, Channel):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'is_empty' must be a channel",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bool(channel.empty()))
+
+    @set_args(["capacity"], [Number(0)])
+    def execute_channel_new_fp(self, exec_ctx):
+        capacity = exec_ctx.symbol_table.get("capacity")
+        if not isinstance(capacity, Number) or capacity.value < 0:
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'new' must be a non-negative number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Channel(int(capacity.value)))
+
+    @set_args([])
+    def execute_channel_new_spsc_fp(self, _):
+        return RTResult().success(SPSCChannel())
+
+    @set_args(
+        ["value1", "value2", "rel_tol", "abs_tol"],
+        [None, None, Number(1e-9), Number(0.0)],
+    )
+    def execute_is_close_fp(self, exec_ctx):
+        v1 = exec_ctx.symbol_table.get("value1").value
+        v2 = exec_ctx.symbol_table.get("value2").value
+        rel_tol = exec_ctx.symbol_table.get("rel_tol").value
+        abs_tol = exec_ctx.symbol_table.get("abs_tol").value
+
+        return RTResult().success(
+            Bool(math.isclose(v1, v2, rel_tol=rel_tol, abs_tol=abs_tol))
+        )
+
+    @set_args(["value"])
+    def execute_is_channel(self, exec_ctx):
+        is_channel = isinstance(exec_ctx.symbol_table.get("value"), Channel)
+        return RTResult().success(Number.true if is_channel else Number.false)
+
+    @set_args(["value"])
+    def execute_is_cfloat(self, exec_ctx):
+        is_cfloat = isinstance(exec_ctx.symbol_table.get("value"), CFloat)
+        return RTResult().success(Number.true if is_cfloat else Number.false)
+
+    @set_args(["value", "supress_error"], [None, Bool.false])
+    def execute_to_cfloat(self, exec_ctx):
+        value = exec_ctx.symbol_table.get("value")
+        supress_error = exec_ctx.symbol_table.get("supress_error")
+
+        if not isinstance(supress_error, Bool):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'to_cfloat' must be a boolean",
+                    exec_ctx,
+                )
+            )
+
+        supress_error_ = bool(supress_error.value)
+
+        try:
+            if isinstance(value, CFloat):
+                result = CFloat(value.value)
+                return RTResult().success(result)
+
+            elif isinstance(value, Number):
+                decimal_value = Fraction(str(value.value))
+                result = CFloat(decimal_value)
+                return RTResult().success(result)
+
+            elif isinstance(value, String):
+                try:
+                    decimal_value = Fraction(value.value)
+                except ZeroDivisionError:
+                    return RTResult().failure(
+                        RTError(
+                            self.pos_start,
+                            self.pos_end,
+                            "Division by zero",
+                            exec_ctx,
+                        )
+                    )
+                result = CFloat(decimal_value)
+                return RTResult().success(result)
+
+            else:
+                if supress_error_:
+                    result = CFloat(Fraction("0"))
+                    return RTResult().success(result)
+                else:
+                    return RTResult().failure(
+                        RTError(
+                            self.pos_start,
+                            self.pos_end,
+                            f"Can't convert '{value.type()}' to decimal",
+                            exec_ctx,
+                        )
+                    )
+
+        except (ValueError, TypeError) as e:
+            if supress_error_:
+                result = CFloat(Fraction("0"))
+                return RTResult().success(result)
+            else:
+                return RTResult().failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"Failed to convert to decimal: {str(e)}",
+                        exec_ctx,
+                    )
+                )
+
+    @set_args(["max_workers"], [Number(5)])
+    def execute_thread_pool_new_fp(self, exec_ctx):
+        max_workers = exec_ctx.symbol_table.get("max_workers")
+        if not isinstance(max_workers, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'new' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(ThreadPool(max_workers.value))
+
+    @set_args(
+        ["pool", "func", "args", "kwargs", "timeout"],
+        [None, None, List([]), HashMap({}), Number.none],
+    )
+    def execute_thread_pool_submit_fp(self, exec_ctx):
+        pool = exec_ctx.symbol_table.get("pool")
+        func = exec_ctx.symbol_table.get("func")
+        args = exec_ctx.symbol_table.get("args")
+        kwargs = exec_ctx.symbol_table.get("kwargs")
+
+        if not isinstance(pool, ThreadPool):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'submit' must be a thread pool",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(func, BaseFunction):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'submit' must be a function",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(args, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'submit' must be a list",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(kwargs, HashMap):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Fourth argument of 'submit' must be a hashmap",
+                    exec_ctx,
+                )
+            )
+
+        positional_args = args.value
+        keyword_args = {
+            k.value: v for k, v in kwargs.value.items() if hasattr(k, "value")
+        }
+
+        timeout, error = self._get_timeout(exec_ctx, "submit", "Fifth")
+        if error:
+            return RTResult().failure(error)
+
+        token = CancelToken(current_cancel_token())
+        future = pool.submit(
+            make_pool_task(func, positional_args, keyword_args, token, timeout)
+        )
+        return RTResult().success(Future(future, token))
+
+    @set_args(["pool", "func", "items", "timeout"], [None, None, None, Number.none])
+    def execute_thread_pool_map_fp(self, exec_ctx):
+        pool = exec_ctx.symbol_table.get("pool")
+        func = exec_ctx.symbol_table.get("func")
+        items = exec_ctx.symbol_table.get("items")
+
+        if not isinstance(pool, ThreadPool):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'map' must be a thread pool",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(func, BaseFunction):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'map' must be a function",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(items, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'map' must be a list",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "map", "Fourth")
+        if error:
+            return RTResult().failure(error)
+
+        parent = current_cancel_token()
+        futures = []
+        for item in items.value:
+            token = CancelToken(parent)
+            futures.append(
+                Future(pool.submit(make_pool_task(func, [item], {}, token)), token)
+            )
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = []
+        for future in futures:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+            res = self._async_result(future.future, remaining, exec_ctx)
+            if res.error:
+                for f in futures:
+                    f.cancel()
+                return res
+            results.append(res.value)
+        return RTResult().success(List(results))
+
+    def _get_futures(self, exec_ctx, fn_name):
+        futures = exec_ctx.symbol_table.get("futures")
+        if not isinstance(futures, List) or not all(
+            isinstance(f, Future) for f in futures.value
+        ):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a list of futures",
+                exec_ctx,
+            )
+        return futures.value, None
+
+    @set_args(["futures"])
+    def execute_thread_pool_as_completed_fp(self, exec_ctx):
+        futures, error = self._get_futures(exec_ctx, "as_completed")
+        if error:
+            return RTResult().failure(error)
+
+        channel = Channel()
+        if not futures:
+            channel.close()
+            return RTResult().success(channel)
+
+        lock = Lock()
+        pending = [len(futures)]
+
+        def make_callback(future_obj):
+            def on_done(_):
+                channel.send(future_obj)
+                with lock:
+                    pending[0] -= 1
+                    if pending[0] == 0:
+                        channel.close()
+
+            return on_done
+
+        for f in futures:
+            f.future.add_done_callback(make_callback(f))
+        return RTResult().success(channel)
+
+    @set_args(["futures", "timeout"], [None, Number.none])
+    def execute_thread_pool_wait_all_fp(self, exec_ctx):
+        futures, error = self._get_futures(exec_ctx, "wait_all")
+        if error:
+            return RTResult().failure(error)
+        timeout, error = self._get_timeout(exec_ctx, "wait_all", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        _, not_done = futures_wait(
+            [f.future for f in futures], timeout, return_when=ALL_COMPLETED
+        )
+        return RTResult().success(Bool(not not_done))
+
+    @set_args(["futures", "timeout"], [None, Number.none])
+    def execute_thread_pool_wait_any_fp(self, exec_ctx):
+        futures, error = self._get_futures(exec_ctx, "wait_any")
+        if error:
+            return RTResult().failure(error)
+        timeout, error = self._get_timeout(exec_ctx, "wait_any", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        done, _ = futures_wait(
+            [f.future for f in futures], timeout, return_when=FIRST_COMPLETED
+        )
+        for f in futures:
+            if f.future in done:
+                return RTResult().success(f)
+        return RTResult().success(Number.none)
+
+    @set_args(["pool"])
+    def execute_thread_pool_stats_fp(self, exec_ctx):
+        pool = exec_ctx.symbol_table.get("pool")
+        if not isinstance(pool, ThreadPool):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'stats' must be a thread pool",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(
+            HashMap({k: Number(v) for k, v in pool.stats().items()})
+        )
+
+    @set_args(["future"])
+    def execute_thread_pool_cancel_fp(self, exec_ctx):
+        future = exec_ctx.symbol_table.get("future")
+        if not isinstance(future, Future):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'cancel' must be a future",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bool(future.cancel()))
+
+    @set_args(
+        ["func", "args", "kwargs", "seconds"], [None, List([]), HashMap({}), None]
+    )
+    def execute_run_with_timeout_fp(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+        args = exec_ctx.symbol_table.get("args")
+        kwargs = exec_ctx.symbol_table.get("kwargs")
+        seconds = exec_ctx.symbol_table.get("seconds")
+        if not isinstance(func, BaseFunction):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'run_with_timeout' must be a function",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(args, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'run_with_timeout' must be a list",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(kwargs, HashMap):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'run_with_timeout' must be a hashmap",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(seconds, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Fourth argument of 'run_with_timeout' must be a number",
+                    exec_ctx,
+                )
+            )
+
+        token = CancelToken(current_cancel_token(), max(seconds.value, 0))
+        previous = push_cancel_token(token)
+        try:
+            res = func.execute(args.value, dict(kwargs.value))
+        finally:
+            pop_cancel_token(previous)
+
+        if res.error:
+            if token.expired() and not (token.parent and token.parent.reason()):
+                return RTResult().success(List([Number.none, Number.true]))
+            return RTResult().failure(res.error)
+        return RTResult().success(List([res.value, Number.false]))
+
+    @set_args(["pool", "wait"], [None, Bool.true])
+    def execute_thread_pool_shutdown_fp(self, exec_ctx):
+        pool = exec_ctx.symbol_table.get("pool")
+        wait = exec_ctx.symbol_table.get("wait")
+
+        if not isinstance(pool, ThreadPool):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'shutdown' must be a thread pool",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(wait, Bool):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'shutdown' must be a boolean",
+                    exec_ctx,
+                )
+            )
+
+        pool.executor.shutdown(wait=wait.value)
+        return RTResult().success(Number.none)
+
+    @set_args(["future"])
+    def execute_future_result_fp(self, exec_ctx):
+        future_obj = exec_ctx.symbol_table.get("future")
+        if not isinstance(future_obj, Future):
+            return RTResult().failure(
+                TError(
+                    self.pos_start, self.pos_end, "Argument must be a future", exec_ctx
+                )
+            )
+
+        try:
+            result = future_obj.future.result()
+            return RTResult().success(result)
+        except ThreadPoolError as e:
+            return RTResult().failure(e.err)
+        except Exception as err:
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Unexpected Python error in 'result': {err}",
+                    exec_ctx,
+                )
+            )
+
+    @set_args(["future"])
+    def execute_future_done_fp(self, exec_ctx):
+        future_obj = exec_ctx.symbol_table.get("future")
+        if not isinstance(future_obj, Future):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'is_done' must be a future",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bool(future_obj.future.done()))
+
+    def _async_result(self, future, timeout, exec_ctx):
+        try:
+            return RTResult().success(future.result(timeout))
+        except ThreadPoolError as e:
+            return RTResult().failure(e.err)
+        except FutureCancelledError:
+            return RTResult().failure(
+                RTError(self.pos_start, self.pos_end, "Task was cancelled", exec_ctx)
+            )
+        except (FutureTimeoutError, asyncio.TimeoutError):
+            return RTResult().failure(
+                RTError(self.pos_start, self.pos_end, "Task timed out", exec_ctx)
+            )
+        except OSError as e:
+            return RTResult().failure(
+                IError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+        except Exception as e:
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Unexpected Python error in async task: {e}",
+                    exec_ctx,
+                )
+            )
+
+    @set_args(["seconds"])
+    def execute_async_sleep_fp(self, exec_ctx):
+        seconds = exec_ctx.symbol_table.get("seconds")
+        if not isinstance(seconds, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'sleep' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(submit_async(async_sleep(seconds.value)))
+
+    @set_args(["path"])
+    def execute_async_read_file_fp(self, exec_ctx):
+        path = exec_ctx.symbol_table.get("path")
+        if not isinstance(path, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'read_file' must be a string",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(submit_async(async_read_file(path.value)))
+
+    @set_args(["path", "data", "mode"], [None, None, String("w")])
+    def execute_async_write_file_fp(self, exec_ctx):
+        path = exec_ctx.symbol_table.get("path")
+        data = exec_ctx.symbol_table.get("data")
+        mode = exec_ctx.symbol_table.get("mode")
+        if not isinstance(path, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'write_file' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(data, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'write_file' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(mode, String) or mode.value not in ("w", "a"):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'write_file' must be 'w' or 'a'",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(
+            submit_async(async_write_file(path.value, data.value, mode.value))
+        )
+
+    @set_args(["command"])
+    def execute_async_run_fp(self, exec_ctx):
+        command = exec_ctx.symbol_table.get("command")
+        if not isinstance(command, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'run' must be a string",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(submit_async(async_run_command(command.value)))
+
+    @set_args(["host", "port", "data", "timeout"], [None, None, String(""), Number(10)])
+    def execute_async_tcp_request_fp(self, exec_ctx):
+        host = exec_ctx.symbol_table.get("host")
+        port = exec_ctx.symbol_table.get("port")
+        data = exec_ctx.symbol_table.get("data")
+        timeout = exec_ctx.symbol_table.get("timeout")
+        if not isinstance(host, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'tcp_request' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(port, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'tcp_request' must be a number",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(data, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'tcp_request' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(timeout, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Fourth argument of 'tcp_request' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(
+            submit_async(
+                async_tcp_request(
+                    host.value, int(port.value), data.value, timeout.value
+                )
+            )
+        )
+
+    @set_args(["future", "timeout"], [None, Number.none])
+    def execute_async_wait_fp(self, exec_ctx):
+        future = exec_ctx.symbol_table.get("future")
+        if not isinstance(future, Future):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'wait' must be a future",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "wait", "Second")
+        if error:
+            return RTResult().failure(error)
+        return self._async_result(future.future, timeout, exec_ctx)
+
+    @set_args(["futures", "timeout"], [None, Number.none])
+    def execute_async_gather_fp(self, exec_ctx):
+        futures = exec_ctx.symbol_table.get("futures")
+        if not isinstance(futures, List) or not all(
+            isinstance(f, Future) for f in futures.value
+        ):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'gather' must be a list of futures",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "gather", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = []
+        for f in futures.value:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+            res = self._async_result(f.future, remaining, exec_ctx)
+            if res.error:
+                return res
+            results.append(res.value)
+        return RTResult().success(List(results))
+
+    @set_args(["future"])
+    def execute_async_cancel_fp(self, exec_ctx):
+        future = exec_ctx.symbol_table.get("future")
+        if not isinstance(future, Future):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'cancel' must be a future",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Bool(future.future.cancel()))
+
+    def _get_worker(self, exec_ctx, fn_name):
+        worker = exec_ctx.symbol_table.get("worker")
+        if not isinstance(worker, Worker):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a worker",
+                exec_ctx,
+            )
+        return worker, None
+
+    @set_args(["func", "args"], [None, List([])])
+    def execute_workers_spawn_fp(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+        args = exec_ctx.symbol_table.get("args")
+        if not isinstance(func, BaseFunction):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'spawn' must be a function",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(args, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'spawn' must be a list",
+                    exec_ctx,
+                )
+            )
+        try:
+            funcs = {}
+            payload = pickle.dumps((funcs, encode_value(func, funcs)))
+        except TypeError as e:
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Function of 'spawn' captures a value of type '{e}' that cannot be sent to a worker process",
+                    exec_ctx,
+                )
+            )
+        try:
+            encoded_args = pack_frame(args)
+        except TypeError as e:
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Value of type '{e}' cannot be sent to a worker process",
+                    exec_ctx,
+                )
+            )
+
+        parent_conn, child_conn = worker_context.Pipe()
+        try:
+            process = worker_context.Process(
+                target=worker_main,
+                args=(child_conn, payload, encoded_args),
+                daemon=True,
+            )
+            process.start()
+        except Exception as e:
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Failed to start worker: {e}",
+                    exec_ctx,
+                )
+            )
+        finally:
+            child_conn.close()
+        return RTResult().success(Worker(process, parent_conn))
+
+    def _send_message(self, conn, value, fn_name, exec_ctx):
+        try:
+            conn.send_bytes(worker_message("msg", value))
+        except TypeError as e:
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Value of type '{e}' cannot be sent to a worker process",
+                    exec_ctx,
+                )
+            )
+        except (OSError, ValueError):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Cannot '{fn_name}': the other side has exited",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number.none)
+
+    @set_args(["worker", "value"])
+    def execute_workers_send_fp(self, exec_ctx):
+        worker, error = self._get_worker(exec_ctx, "send")
+        if error:
+            return RTResult().failure(error)
+        value = exec_ctx.symbol_table.get("value")
+        return self._send_message(worker.conn, value, "send", exec_ctx)
+
+    @set_args(["worker", "timeout"], [None, Number.none])
+    def execute_workers_receive_fp(self, exec_ctx):
+        worker, error = self._get_worker(exec_ctx, "recv")
+        if error:
+            return RTResult().failure(error)
+        timeout, error = self._get_timeout(exec_ctx, "recv", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        status, value = worker_read(worker, timeout)
+        if status == "timeout":
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Timed out receiving from worker",
+                    exec_ctx,
+                )
+            )
+        if status == "closed":
+            return RTResult().success(Number.none)
+        return RTResult().success(value)
+
+    @set_args(["worker", "timeout"], [None, Number.none])
+    def execute_workers_join_fp(self, exec_ctx):
+        worker, error = self._get_worker(exec_ctx, "join")
+        if error:
+            return RTResult().failure(error)
+        timeout, error = self._get_timeout(exec_ctx, "join", "Second")
+        if error:
+            return RTResult().failure(error)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not worker.finished:
+            remaining = None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+            if not worker.conn.poll(remaining):
+                return RTResult().failure(
+                    RTError(
+                        self.pos_start,
+                        self.pos_end,
+                        "Timed out waiting for worker",
+                        exec_ctx,
+                    )
+                )
+            pending = list(worker.pending)
+            worker.pending.clear()
+            status, value = worker_read(worker, 0)
+            worker.pending.extend(pending)
+            if status == "ok":
+                worker.pending.append(value)
+        worker.process.join()
+
+        if worker.outcome[0] == "error":
+            return RTResult().failure(
+                remote_error(
+                    worker.outcome[1],
+                    worker.outcome[2],
+                    self.pos_start,
+                    self.pos_end,
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(worker.outcome[1])
+
+    @set_args(["worker"])
+    def execute_workers_is_alive_fp(self, exec_ctx):
+        worker, error = self._get_worker(exec_ctx, "is_alive")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(Bool(worker.process.is_alive()))
+
+    @set_args(["worker"])
+    def execute_workers_kill_fp(self, exec_ctx):
+        worker, error = self._get_worker(exec_ctx, "kill")
+        if error:
+            return RTResult().failure(error)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        return RTResult().success(Number.none)
+
+    @set_args(["value"])
+    def execute_workers_send_parent_fp(self, exec_ctx):
+        if current_worker_conn is None:
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "'send_parent' can only be used inside a worker",
+                    exec_ctx,
+                )
+            )
+        value = exec_ctx.symbol_table.get("value")
+        return self._send_message(current_worker_conn, value, "send_parent", exec_ctx)
+
+    @set_args(["timeout"], [Number.none])
+    def execute_workers_receive_parent_fp(self, exec_ctx):
+        if current_worker_conn is None:
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "'recv_parent' can only be used inside a worker",
+                    exec_ctx,
+                )
+            )
+        timeout, error = self._get_timeout(exec_ctx, "recv_parent", "First")
+        if error:
+            return RTResult().failure(error)
+
+        if not current_worker_conn.poll(timeout):
+            return RTResult().failure(
+                RTError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Timed out receiving from parent",
+                    exec_ctx,
+                )
+            )
+        try:
+            _, values = read_worker_message(current_worker_conn)
+        except (EOFError, OSError):
+            return RTResult().success(Number.none)
+        return RTResult().success(values[0])
+
+    def _run_parallel(self, exec_ctx, mode, initial=None):
+        func = exec_ctx.symbol_table.get("func")
+        items = exec_ctx.symbol_table.get("items")
+        workers = exec_ctx.symbol_table.get("workers")
+        chunk_size = exec_ctx.symbol_table.get("chunk_size")
+
+        if not isinstance(func, BaseFunction):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{mode}' must be a function",
+                exec_ctx,
+            )
+        if not isinstance(items, List):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"Second argument of '{mode}' must be a list",
+                exec_ctx,
+            )
+        if not isinstance(workers, Number) or not isinstance(chunk_size, Number):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"'workers' and 'chunk_size' of '{mode}' must be numbers",
+                exec_ctx,
+            )
+
+        try:
+            funcs = {}
+            payload = pickle.dumps((funcs, encode_value(func, funcs)))
+        except TypeError as e:
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"Function of '{mode}' captures a value of type '{e}' that cannot be sent to a worker process",
+                exec_ctx,
+            )
+        try:
+            values = [encode_value(v, None) for v in items.value]
+        except TypeError as e:
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"Second argument of '{mode}' contains a value of type '{e}' that cannot be sent to a worker process",
+                exec_ctx,
+            )
+
+        n_workers = int(workers.value) or os.cpu_count() or 1
+        size = int(chunk_size.value)
+        if size <= 0:
+            size = max(1, -(-len(values) // (n_workers * 4)))
+        chunks = [values[i : i + size] for i in range(0, len(values), size)]
+        initials = [None] * len(chunks)
+        if initial is not None and chunks:
+            initials[0] = (encode_value(initial, None),)
+
+        try:
+            if n_workers < 2 or len(chunks) < 2:
+                results = [
+                    parallel_worker(payload, mode, chunk, init)
+                    for chunk, init in zip(chunks, initials)
+                ]
+            else:
+                executor = get_parallel_executor(n_workers)
+                results = list(
+                    executor.map(
+                        parallel_worker,
+                        [payload] * len(chunks),
+                        [mode] * len(chunks),
+                        chunks,
+                        initials,
+                    )
+                )
+        except Exception as e:
+            return None, RTError(
+                self.pos_start,
+                self.pos_end,
+                f"Worker process failed in '{mode}': {e}",
+                exec_ctx,
+            )
+
+        for result in results:
+            if result[0] == "error":
+                return None, remote_error(
+                    result[1], result[2], self.pos_start, self.pos_end, exec_ctx
+                )
+
+        return [
+            (result[1], offset)
+            for result, offset in zip(results, range(0, len(values), size))
+        ], None
+
+    @set_args(
+        ["func", "items", "workers", "chunk_size"], [None, None, Number(0), Number(0)]
+    )
+    def execute_parallel_map_fp(self, exec_ctx):
+        results, error = self._run_parallel(exec_ctx, "map")
+        if error:
+            return RTResult().failure(error)
+
+        out = []
+        for values, _ in results:
+            out.extend(decode_value(v, None, None, None) for v in values)
+        return RTResult().success(List(out))
+
+    @set_args(
+        ["func", "items", "workers", "chunk_size"], [None, None, Number(0), Number(0)]
+    )
+    def execute_parallel_filter_fp(self, exec_ctx):
+        results, error = self._run_parallel(exec_ctx, "filter")
+        if error:
+            return RTResult().failure(error)
+
+        items = exec_ctx.symbol_table.get("items").value
+        out = []
+        for indices, offset in results:
+            out.extend(items[offset + i] for i in indices)
+        return RTResult().success(List(out))
+
+    @set_args(
+        ["func", "items", "initial", "workers", "chunk_size"],
+        [None, None, None, Number(0), Number(0)],
+    )
+    def execute_parallel_reduce_fp(self, exec_ctx):
+        func = exec_ctx.symbol_table.get("func")
+        initial = exec_ctx.symbol_table.get("initial")
+        results, error = self._run_parallel(exec_ctx, "reduce", initial)
+        if error:
+            return RTResult().failure(error)
+        if not results:
+            return RTResult().success(initial)
+
+        acc = decode_value(results[0][0], None, None, None)
+        for value, _ in results[1:]:
+            res = func.execute([acc, decode_value(value, None, None, None)], {})
+            if res.error:
+                return RTResult().failure(res.error)
+            acc = res.value
+        return RTResult().success(acc)
+
+    @set_args(["message", "title"])
+    def execute_msgbox_alert_fp(self, exec_ctx):
+        msg = exec_ctx.symbol_table.get("message")
+        title = exec_ctx.symbol_table.get("title")
+
+        if not isinstance(msg, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'alert' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(title, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'alert' must be a string",
+                    exec_ctx,
+                )
+            )
+
+        try:
+            import pyautogui  # type: ignore
+
+            result = pyautogui.alert(str(msg.value), str(title.value))
+            return RTResult().success(Number.none)
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(
+        ["message", "title", "buttons"],
+        [None, None, List([String("Ok"), String("Cancel")])],
+    )
+    def execute_msgbox_confirm_fp(self, exec_ctx):
+        msg = exec_ctx.symbol_table.get("message")
+        title = exec_ctx.symbol_table.get("title")
+        buttons = exec_ctx.symbol_table.get("buttons")
+
+        if not isinstance(msg, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'confirm' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(title, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'confirm' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(buttons, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Third argument of 'confirm' must be a list",
+                    exec_ctx,
+                )
+            )
+
+        try:
+            import pyautogui  # type: ignore
+
+            result = pyautogui.confirm(
+                str(msg.value),
+                str(title.value),
+                [str(b.value) for b in buttons.elements if isinstance(b, String)],
+            )
+            return RTResult().success(String(result if result else Number.none))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["message", "title"])
+    def execute_msgbox_prompt_fp(self, exec_ctx):
+        msg = exec_ctx.symbol_table.get("message")
+        title = exec_ctx.symbol_table.get("title")
+
+        if not isinstance(msg, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'prompt' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(title, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'prompt' must be a string",
+                    exec_ctx,
+                )
+            )
+
+        try:
+            import pyautogui  # type: ignore
+
+            result = pyautogui.prompt(str(msg.value), str(title.value))
+            return RTResult().success(String(result if result else Number.none))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["message", "title"])
+    def execute_msgbox_password_fp(self, exec_ctx):
+        msg = exec_ctx.symbol_table.get("message")
+        title = exec_ctx.symbol_table.get("title")
+
+        if not isinstance(msg, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'password' must be a string",
                     exec_ctx,
                 )
             )
@@ -4409,427 +7671,872 @@ class BuiltInFunction(BaseFunction):
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'password' must be a string",
+                    "Second argument of 'password' must be a string",
+                    exec_ctx,
+                )
+            )
+
+        try:
+            import pyautogui  # type: ignore
+
+            result = pyautogui.password(str(msg.value), str(title.value))
+            return RTResult().success(String(result if result else Number.none))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args([])
+    def execute_datetime_now_fp(self, exec_ctx):
+        try:
+            result = datetime.now().isoformat(" ")
+            return RTResult().success(String(result))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args([])
+    def execute_date_today_fp(self, exec_ctx):
+        try:
+            result = date.today().isoformat()
+            return RTResult().success(String(result))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["fmt"])
+    def execute_datetime_format_fp(self, exec_ctx):
+        fmt = exec_ctx.symbol_table.get("fmt")
+        if not isinstance(fmt, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'format' must be a string",
+                    exec_ctx,
+                )
+            )
+        try:
+            result = datetime.now().strftime(fmt.value)
+            return RTResult().success(String(result))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["s", "fmt"])
+    def execute_datetime_parse_fp(self, exec_ctx):
+        s = exec_ctx.symbol_table.get("s")
+        fmt = exec_ctx.symbol_table.get("fmt")
+        if not isinstance(s, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'parse' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(fmt, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'parse' must be a string",
+                    exec_ctx,
+                )
+            )
+        try:
+            dt = datetime.strptime(s.value, fmt.value)
+            return RTResult().success(String(dt.isoformat(" ")))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["days"])
+    def execute_datetime_add_days_fp(self, exec_ctx):
+        days = exec_ctx.symbol_table.get("days")
+        if not isinstance(days, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'add_days' must be a number",
+                    exec_ctx,
+                )
+            )
+        try:
+            new_dt = datetime.now() + timedelta(days=int(days.value))
+            return RTResult().success(String(new_dt.isoformat(" ")))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["dt1", "dt2"])
+    def execute_datetime_diff_fp(self, exec_ctx):
+        dt1 = exec_ctx.symbol_table.get("dt1")
+        dt2 = exec_ctx.symbol_table.get("dt2")
+        if not isinstance(dt1, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'diff' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(dt2, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'diff' must be a string",
+                    exec_ctx,
+                )
+            )
+        try:
+            d1 = datetime.fromisoformat(dt1.value)
+            d2 = datetime.fromisoformat(dt2.value)
+            delta = d1 - d2
+            return RTResult().success(Number(delta.days))
+        except Exception as e:
+            return RTResult().failure(
+                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            )
+
+    @set_args(["str", "lst"])
+    def execute_string_format_fp(self, exec_ctx):
+        _str = exec_ctx.symbol_table.get("str")
+        lst = exec_ctx.symbol_table.get("lst")
+
+        if not isinstance(_str, String):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'format' must be a string",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(lst, List):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'format' must be a list",
+                    exec_ctx,
+                )
+            )
+        r = _str.value.format(*lst.value)
+        return RTResult().success(String(r))
+
+    @set_args(["value"])
+    def execute_clone(
+        self, exec_ctx
+    ):  # This may cause lag if overused, and should only be used for functions or namespaces when truly needed
+        value = exec_ctx.symbol_table.get("value")
+        return RTResult().success(deepcopy(value))
+
+    @set_args(["a", "b"])
+    def execute_shl(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        b = exec_ctx.symbol_table.get("b")
+        if not isinstance(a, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'shl' must be a number",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(b, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'shl' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number(int(a.value) << int(b.value)))
+
+    @set_args(["a", "b"])
+    def execute_shr(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        b = exec_ctx.symbol_table.get("b")
+        if not isinstance(a, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'shr' must be a number",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(b, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'shr' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number(int(a.value) >> int(b.value)))
+
+    @set_args(["a", "b"])
+    def execute_bitwise_and(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        b = exec_ctx.symbol_table.get("b")
+        if not isinstance(a, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'bitwise_and' must be a number",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(b, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'bitwise_and' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number(int(a.value) & int(b.value)))
+
+    @set_args(["a", "b"])
+    def execute_bitwise_or(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        b = exec_ctx.symbol_table.get("b")
+        if not isinstance(a, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'bitwise_or' must be a number",
+                    exec_ctx,
+                )
+            )
+        if not isinstance(b, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'bitwise_or' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number(int(a.value) | int(b.value)))
+
+    @set_args(["a", "b"])
+    def execute_bitwise_xor(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        b = exec_ctx.symbol_table.get("b")
+        if not isinstance(a, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'bitwise_xor' must be a number",
                     exec_ctx,
                 )
             )
+        if not isinstance(b, Number):
+            return RTResult().failure(
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "Second argument of 'bitwise_xor' must be a number",
+                    exec_ctx,
+                )
+            )
+        return RTResult().success(Number(int(a.value) ^ int(b.value)))
 
-        try:
-            import pyautogui  # type: ignore
-
-            result = pyautogui.password(str(msg.value), str(title.value))
-            return RTResult().success(String(result if result else Number.none))
-        except Exception as e:
+    @set_args(["a"])
+    def execute_bitwise_not(self, exec_ctx):
+        a = exec_ctx.symbol_table.get("a")
+        if not isinstance(a, Number):
             return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'bitwise_not' must be a number",
+                    exec_ctx,
+                )
             )
+        return RTResult().success(Number(~int(a.value)))
 
-    @set_args([])
-    def execute_datetime_now_fp(self, exec_ctx):
-        try:
-            result = datetime.now().isoformat(" ")
-            return RTResult().success(String(result))
-        except Exception as e:
+    @set_args(["file_path"])
+    def execute_read_csv_fp(self, exec_ctx):
+        file_path_obj = exec_ctx.symbol_table.get("file_path")
+        if not isinstance(file_path_obj, String):
             return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+                TError(
+                    self.pos_start,
+                    self.pos_end,
+                    "First argument of 'read' must be a string",
+                    exec_ctx,
+                )
             )
 
-    @set_args([])
-    def execute_date_today_fp(self, exec_ctx):
         try:
-            result = date.today().isoformat()
-            return RTResult().success(String(result))
-        except Exception as e:
-            return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+            file_path = file_path_obj.value
+            with open(file_path, mode="r", newline="", encoding="utf-8") as csvfile:
+                reader = csv.reader(csvfile)
+
+                try:
+                    header = next(reader)
+                except StopIteration:
+                    return RTResult().success(HashMap({}))
+
+                py_data = {col_name: [] for col_name in header}
+
+                for row in reader:
+                    if len(row) == len(header):
+                        for col_name, cell_value in zip(header, row):
+                            py_data[col_name].append(String(cell_value))
+
+            return RTResult().success(
+                HashMap({name: List(column) for name, column in py_data.items()})
             )
 
-    @set_args(["fmt"])
-    def execute_datetime_format_fp(self, exec_ctx):
-        fmt = exec_ctx.symbol_table.get("fmt")
-        if not isinstance(fmt, String):
+        except FileNotFoundError:
             return RTResult().failure(
-                TError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'format' must be a string",
+                    f"File not found: '{file_path_obj.value}'",
                     exec_ctx,
                 )
             )
-        try:
-            result = datetime.now().strftime(fmt.value)
-            return RTResult().success(String(result))
         except Exception as e:
             return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Error reading CSV file: {e}",
+                    exec_ctx,
+                )
             )
 
-    @set_args(["s", "fmt"])
-    def execute_datetime_parse_fp(self, exec_ctx):
-        s = exec_ctx.symbol_table.get("s")
-        fmt = exec_ctx.symbol_table.get("fmt")
-        if not isinstance(s, String):
+    @set_args(["file_path", "data"])
+    def execute_write_csv_fp(self, exec_ctx):
+        file_path_obj = exec_ctx.symbol_table.get("file_path")
+        data_obj = exec_ctx.symbol_table.get("data")
+
+        if not isinstance(file_path_obj, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'parse' must be a string",
+                    "First argument of 'write' must be a string",
                     exec_ctx,
                 )
             )
-        if not isinstance(fmt, String):
+        if not isinstance(data_obj, HashMap):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'parse' must be a string",
+                    "Second argument of 'write' must be a hashmap",
                     exec_ctx,
                 )
             )
+
         try:
-            dt = datetime.strptime(s.value, fmt.value)
-            return RTResult().success(String(dt.isoformat(" ")))
+            py_data = self.convert_zer_to_py(data_obj)
+
+            if not py_data:
+                open(file_path_obj.value, "w").close()
+                return RTResult().success(Number.none)
+
+            columns = list(py_data.values())
+            if columns:
+                num_rows = len(columns[0])
+                for col in columns[1:]:
+                    if len(col) != num_rows:
+                        return RTResult().failure(
+                            RTError(
+                                self.pos_start,
+                                self.pos_end,
+                                "All columns in the hashmap must have the same number of rows",
+                                exec_ctx,
+                            )
+                        )
+
+            header = list(py_data.keys())
+            rows_to_write = zip(*py_data.values())
+
+            with open(
+                file_path_obj.value, mode="w", newline="", encoding="utf-8"
+            ) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(header)
+                writer.writerows(rows_to_write)
+
+            return RTResult().success(Number.none)
         except Exception as e:
             return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
+                IError(
+                    self.pos_start,
+                    self.pos_end,
+                    f"Error writing to CSV file: {e}",
+                    exec_ctx,
+                )
             )
 
-    @set_args(["days"])
-    def execute_datetime_add_days_fp(self, exec_ctx):
-        days = exec_ctx.symbol_table.get("days")
-        if not isinstance(days, Number):
+    @set_args(
+        ["file_path", "records", "infer", "batch_size", "delimiter"],
+        [None, Bool.false, Bool.false, Number(0), String(",")],
+    )
+    def execute_csv_rows_fp(self, exec_ctx):
+        file_path = exec_ctx.symbol_table.get("file_path")
+        records = exec_ctx.symbol_table.get("records")
+        infer = exec_ctx.symbol_table.get("infer")
+        batch_size = exec_ctx.symbol_table.get("batch_size")
+        delimiter = exec_ctx.symbol_table.get("delimiter")
+        if not isinstance(file_path, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'add_days' must be a number",
+                    "First argument of 'rows' must be a string",
                     exec_ctx,
                 )
             )
-        try:
-            new_dt = datetime.now() + timedelta(days=int(days.value))
-            return RTResult().success(String(new_dt.isoformat(" ")))
-        except Exception as e:
-            return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
-            )
-
-    @set_args(["dt1", "dt2"])
-    def execute_datetime_diff_fp(self, exec_ctx):
-        dt1 = exec_ctx.symbol_table.get("dt1")
-        dt2 = exec_ctx.symbol_table.get("dt2")
-        if not isinstance(dt1, String):
+        if not isinstance(batch_size, Number) or batch_size.value < 0:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'diff' must be a string",
+                    "Batch size must be a non-negative number",
                     exec_ctx,
                 )
             )
-        if not isinstance(dt2, String):
+        if not isinstance(delimiter, String) or len(delimiter.value) != 1:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'diff' must be a string",
+                    "Delimiter must be a single character",
                     exec_ctx,
                 )
             )
         try:
-            d1 = datetime.fromisoformat(dt1.value)
-            d2 = datetime.fromisoformat(dt2.value)
-            delta = d1 - d2
-            return RTResult().success(Number(delta.days))
-        except Exception as e:
-            return RTResult().failure(
-                TError(self.pos_start, self.pos_end, str(e), exec_ctx)
-            )
-
-    @set_args(["str", "lst"])
-    def execute_string_format_fp(self, exec_ctx):
-        _str = exec_ctx.symbol_table.get("str")
-        lst = exec_ctx.symbol_table.get("lst")
-
-        if not isinstance(_str, String):
+            handle = open(file_path.value, mode="r", newline="", encoding="utf-8")
+        except FileNotFoundError:
             return RTResult().failure(
-                TError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'format' must be a string",
+                    f"File not found: '{file_path.value}'",
                     exec_ctx,
                 )
             )
-        if not isinstance(lst, List):
+        except Exception as e:
             return RTResult().failure(
-                TError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'format' must be a list",
+                    f"Error reading CSV file: {e}",
                     exec_ctx,
                 )
             )
-        r = _str.value.format(*lst.value)
-        return RTResult().success(String(r))
-
-    @set_args(["value"])
-    def execute_clone(
-        self, exec_ctx
-    ):  # This may cause lag if overused, and should only be used for functions or namespaces when truly needed
-        value = exec_ctx.symbol_table.get("value")
-        return RTResult().success(deepcopy(value))
+        rows = iter_csv_rows(
+            handle,
+            file_path.value,
+            records.is_true(),
+            infer.is_true(),
+            int(batch_size.value),
+            delimiter.value,
+        )
+        return RTResult().success(Iterator(rows, file_path.value))
 
-    @set_args(["a", "b"])
-    def execute_shl(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        b = exec_ctx.symbol_table.get("b")
-        if not isinstance(a, Number):
+    @set_args(
+        ["file_path", "header", "append", "delimiter"],
+        [None, Number.none, Bool.false, String(",")],
+    )
+    def execute_csv_writer_fp(self, exec_ctx):
+        file_path = exec_ctx.symbol_table.get("file_path")
+        header = exec_ctx.symbol_table.get("header")
+        append = exec_ctx.symbol_table.get("append")
+        delimiter = exec_ctx.symbol_table.get("delimiter")
+        if not isinstance(file_path, String):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'shl' must be a number",
+                    "First argument of 'writer' must be a string",
                     exec_ctx,
                 )
             )
-        if not isinstance(b, Number):
+        if not isinstance(header, List | NoneObject):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'shl' must be a number",
+                    "Second argument of 'writer' must be a list or none",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Number(int(a.value) << int(b.value)))
-
-    @set_args(["a", "b"])
-    def execute_shr(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        b = exec_ctx.symbol_table.get("b")
-        if not isinstance(a, Number):
+        if not isinstance(delimiter, String) or len(delimiter.value) != 1:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'shr' must be a number",
+                    "Delimiter must be a single character",
                     exec_ctx,
                 )
             )
-        if not isinstance(b, Number):
+        names = None
+        if isinstance(header, List):
+            names = [str(self.convert_zer_to_py(name)) for name in header.value]
+        try:
+            handle = open(
+                file_path.value,
+                mode="a" if append.is_true() else "w",
+                newline="",
+                encoding="utf-8",
+            )
+            writer = csv.writer(handle, delimiter=delimiter.value)
+            if names is not None and not (append.is_true() and handle.tell() > 0):
+                writer.writerow(names)
+        except Exception as e:
             return RTResult().failure(
-                TError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'shr' must be a number",
+                    f"Error writing to CSV file: {e}",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Number(int(a.value) >> int(b.value)))
+        return RTResult().success(CSVWriter(file_path.value, handle, writer, names))
 
-    @set_args(["a", "b"])
-    def execute_bitwise_and(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        b = exec_ctx.symbol_table.get("b")
-        if not isinstance(a, Number):
-            return RTResult().failure(
-                TError(
+    def _csv_row(self, writer, row, exec_ctx):
+        if isinstance(row, List):
+            return [self.convert_zer_to_py(cell) for cell in row.value], None
+        if isinstance(row, HashMap):
+            if writer.header is None:
+                return None, RTError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'bitwise_and' must be a number",
+                    "Cannot write a hashmap row to a CSV writer without a header",
                     exec_ctx,
                 )
+            return [
+                self.convert_zer_to_py(row.value.get(name, Number.none))
+                for name in writer.header
+            ], None
+        return None, TError(
+            self.pos_start,
+            self.pos_end,
+            "CSV rows must be lists or hashmaps",
+            exec_ctx,
+        )
+
+    def _get_csv_writer(self, exec_ctx, fn_name):
+        writer = exec_ctx.symbol_table.get("writer")
+        if not isinstance(writer, CSVWriter):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"First argument of '{fn_name}' must be a CSV writer",
+                exec_ctx,
             )
-        if not isinstance(b, Number):
+        if writer.handle.closed:
+            return None, IError(
+                self.pos_start,
+                self.pos_end,
+                f"Cannot '{fn_name}' on a closed CSV writer",
+                exec_ctx,
+            )
+        return writer, None
+
+    @set_args(["writer", "row"])
+    def execute_csv_write_row_fp(self, exec_ctx):
+        writer, error = self._get_csv_writer(exec_ctx, "write_row")
+        if error:
+            return RTResult().failure(error)
+        row, error = self._csv_row(writer, exec_ctx.symbol_table.get("row"), exec_ctx)
+        if error:
+            return RTResult().failure(error)
+        try:
+            writer.writer.writerow(row)
+        except Exception as e:
             return RTResult().failure(
-                TError(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'bitwise_and' must be a number",
+                    f"Error writing to CSV file: {e}",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Number(int(a.value) & int(b.value)))
+        return RTResult().success(Number.none)
 
-    @set_args(["a", "b"])
-    def execute_bitwise_or(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        b = exec_ctx.symbol_table.get("b")
-        if not isinstance(a, Number):
+    @set_args(["writer", "rows"])
+    def execute_csv_write_rows_fp(self, exec_ctx):
+        writer, error = self._get_csv_writer(exec_ctx, "write_rows")
+        if error:
+            return RTResult().failure(error)
+        rows = exec_ctx.symbol_table.get("rows")
+        if not isinstance(rows, List | Iterator):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'bitwise_or' must be a number",
+                    "Second argument of 'write_rows' must be a list or an iterator",
                     exec_ctx,
                 )
             )
-        if not isinstance(b, Number):
+        source, _ = rows.iter()
+        try:
+            for item in source:
+                row, error = self._csv_row(writer, item, exec_ctx)
+                if error:
+                    return RTResult().failure(error)
+                writer.writer.writerow(row)
+        except IterError as e:
             return RTResult().failure(
-                TError(
+                RTError(self.pos_start, self.pos_end, e.message, exec_ctx)
+            )
+        except Exception as e:
+            return RTResult().failure(
+                IError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'bitwise_or' must be a number",
+                    f"Error writing to CSV file: {e}",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Number(int(a.value) | int(b.value)))
+        return RTResult().success(Number.none)
 
-    @set_args(["a", "b"])
-    def execute_bitwise_xor(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        b = exec_ctx.symbol_table.get("b")
-        if not isinstance(a, Number):
+    @set_args(["writer"])
+    def execute_csv_close_fp(self, exec_ctx):
+        writer = exec_ctx.symbol_table.get("writer")
+        if not isinstance(writer, CSVWriter):
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'bitwise_xor' must be a number",
+                    "First argument of 'close' must be a CSV writer",
                     exec_ctx,
                 )
             )
-        if not isinstance(b, Number):
+        writer.close()
+        return RTResult().success(Number.none)
+
+    def _get_array(self, exec_ctx, name, fn_name, position):
+        value = exec_ctx.symbol_table.get(name)
+        if not isinstance(value, Array):
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"{position} argument of '{fn_name}' must be an array",
+                exec_ctx,
+            )
+        return value, None
+
+    def _get_array_code(self, exec_ctx, fn_name, position):
+        dtype = exec_ctx.symbol_table.get("dtype")
+        if not isinstance(dtype, String) or dtype.value not in ARRAY_TYPECODES:
+            return None, TError(
+                self.pos_start,
+                self.pos_end,
+                f"{position} argument of '{fn_name}' must be 'int' or 'float'",
+                exec_ctx,
+            )
+        return ARRAY_TYPECODES[dtype.value], None
+
+    @set_args(["values", "dtype"], [None, String("float")])
+    def execute_array_new_fp(self, exec_ctx):
+        values = exec_ctx.symbol_table.get("values")
+        code, error = self._get_array_code(exec_ctx, "new", "Second")
+        if error:
+            return RTResult().failure(error)
+        if isinstance(values, Array):
+            source = values.value
+        elif isinstance(values, List):
+            source = []
+            for item in values.value:
+                if not isinstance(item, Number) or isinstance(item, NoneObject):
+                    return RTResult().failure(
+                        TError(
+                            self.pos_start,
+                            self.pos_end,
+                            "Array elements must be numbers",
+                            exec_ctx,
+                        )
+                    )
+                source.append(item.value)
+        else:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'bitwise_xor' must be a number",
+                    "First argument of 'new' must be a list or an array",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Number(int(a.value) ^ int(b.value)))
-
-    @set_args(["a"])
-    def execute_bitwise_not(self, exec_ctx):
-        a = exec_ctx.symbol_table.get("a")
-        if not isinstance(a, Number):
+        try:
+            if code == "q":
+                result = array(code, map(int, source))
+            else:
+                result = array(code, source)
+        except OverflowError:
             return RTResult().failure(
-                TError(
+                MError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'bitwise_not' must be a number",
+                    "Integer is too large for an int array",
                     exec_ctx,
                 )
             )
-        return RTResult().success(Number(~int(a.value)))
+        return RTResult().success(Array(result))
 
-    @set_args(["file_path"])
-    def execute_read_csv_fp(self, exec_ctx):
-        file_path_obj = exec_ctx.symbol_table.get("file_path")
-        if not isinstance(file_path_obj, String):
+    @set_args(["size", "dtype"], [None, String("float")])
+    def execute_array_zeros_fp(self, exec_ctx):
+        size = exec_ctx.symbol_table.get("size")
+        code, error = self._get_array_code(exec_ctx, "zeros", "Second")
+        if error:
+            return RTResult().failure(error)
+        if not isinstance(size, Number) or size.value < 0:
             return RTResult().failure(
                 TError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'read' must be a string",
+                    "First argument of 'zeros' must be a non-negative number",
                     exec_ctx,
                 )
             )
+        return RTResult().success(Array(array(code, bytes(8 * int(size.value)))))
 
-        try:
-            file_path = file_path_obj.value
-            with open(file_path, mode="r", newline="", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-
-                try:
-                    header = next(reader)
-                except StopIteration:
-                    return RTResult().success(HashMap({}))
-
-                py_data = {col_name: [] for col_name in header}
-
-                for row in reader:
-                    if len(row) == len(header):
-                        for col_name, cell_value in zip(header, row):
-                            py_data[col_name].append(cell_value)
-
-            zyx_hashmap = self.validate_pyexec_result(py_data)
-            return RTResult().success(zyx_hashmap)
-
-        except FileNotFoundError:
+    @set_args(["start", "stop", "step"], [None, None, Number(1)])
+    def execute_array_range_fp(self, exec_ctx):
+        bounds = [exec_ctx.symbol_table.get(name) for name in ("start", "stop", "step")]
+        for value, position in zip(bounds, ("First", "Second", "Third")):
+            if not isinstance(value, Number) or isinstance(value, NoneObject):
+                return RTResult().failure(
+                    TError(
+                        self.pos_start,
+                        self.pos_end,
+                        f"{position} argument of 'range' must be a number",
+                        exec_ctx,
+                    )
+                )
+        start, stop, step = (value.value for value in bounds)
+        if step == 0:
             return RTResult().failure(
-                IError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    f"File not found: '{file_path_obj.value}'",
+                    "Step of 'range' must not be zero",
                     exec_ctx,
                 )
             )
-        except Exception as e:
+        if all(type(value) is int for value in (start, stop, step)):
+            return RTResult().success(Array(array("q", range(start, stop, step))))
+        count = max(math.ceil((stop - start) / step), 0)
+        return RTResult().success(
+            Array(array("d", (start + i * step for i in range(count))))
+        )
+
+    @set_args(["arr"])
+    def execute_array_to_list_fp(self, exec_ctx):
+        arr, error = self._get_array(exec_ctx, "arr", "to_list", "First")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(List([Number(value) for value in arr.value]))
+
+    @set_args(["arr"])
+    def execute_array_dtype_fp(self, exec_ctx):
+        arr, error = self._get_array(exec_ctx, "arr", "dtype", "First")
+        if error:
+            return RTResult().failure(error)
+        return RTResult().success(String(arr.dtype()))
+
+    @set_args(["arr", "op"])
+    def execute_array_reduce_fp(self, exec_ctx):
+        op = exec_ctx.symbol_table.get("op")
+        if not isinstance(op, String) or op.value not in ARRAY_REDUCE_OPS:
             return RTResult().failure(
-                IError(
+                TError(
                     self.pos_start,
                     self.pos_end,
-                    f"Error reading CSV file: {e}",
+                    "Second argument of 'reduce' must be 'sum', 'min', 'max' or 'mean'",
                     exec_ctx,
                 )
             )
-
-    @set_args(["file_path", "data"])
-    def execute_write_csv_fp(self, exec_ctx):
-        file_path_obj = exec_ctx.symbol_table.get("file_path")
-        data_obj = exec_ctx.symbol_table.get("data")
-
-        if not isinstance(file_path_obj, String):
+        arr, error = self._get_array(exec_ctx, "arr", op.value, "First")
+        if error:
+            return RTResult().failure(error)
+        values = arr.value
+        if op.value == "sum":
+            return RTResult().success(Number(sum(values)))
+        if not values:
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "First argument of 'write' must be a string",
+                    f"Cannot compute {op.value} of an empty array",
                     exec_ctx,
                 )
             )
-        if not isinstance(data_obj, HashMap):
+        if op.value == "min":
+            return RTResult().success(Number(min(values)))
+        if op.value == "max":
+            return RTResult().success(Number(max(values)))
+        return RTResult().success(Number(sum(values) / len(values)))
+
+    @set_args(["arr", "other"])
+    def execute_array_dot_fp(self, exec_ctx):
+        arr, error = self._get_array(exec_ctx, "arr", "dot", "First")
+        if error:
+            return RTResult().failure(error)
+        other, error = self._get_array(exec_ctx, "other", "dot", "Second")
+        if error:
+            return RTResult().failure(error)
+        if len(arr.value) != len(other.value):
             return RTResult().failure(
-                TError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    "Second argument of 'write' must be a hashmap",
+                    f"Array sizes do not match ({len(arr.value)} and {len(other.value)})",
                     exec_ctx,
                 )
             )
+        return RTResult().success(
+            Number(sum(map(operator.mul, arr.value, other.value)))
+        )
 
-        try:
-            py_data = self.convert_zer_to_py(data_obj)
-
-            if not py_data:
-                open(file_path_obj.value, "w").close()
-                return RTResult().success(Number.none)
-
-            columns = list(py_data.values())
-            if columns:
-                num_rows = len(columns[0])
-                for col in columns[1:]:
-                    if len(col) != num_rows:
-                        return RTResult().failure(
-                            RTError(
-                                self.pos_start,
-                                self.pos_end,
-                                "All columns in the hashmap must have the same number of rows",
-                                exec_ctx,
-                            )
-                        )
-
-            header = list(py_data.keys())
-            rows_to_write = zip(*py_data.values())
-
-            with open(
-                file_path_obj.value, mode="w", newline="", encoding="utf-8"
-            ) as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(header)
-                writer.writerows(rows_to_write)
-
-            return RTResult().success(Number.none)
-        except Exception as e:
+    @set_args(["arr", "mask"])
+    def execute_array_select_fp(self, exec_ctx):
+        arr, error = self._get_array(exec_ctx, "arr", "select", "First")
+        if error:
+            return RTResult().failure(error)
+        mask, error = self._get_array(exec_ctx, "mask", "select", "Second")
+        if error:
+            return RTResult().failure(error)
+        if len(arr.value) != len(mask.value):
             return RTResult().failure(
-                IError(
+                RTError(
                     self.pos_start,
                     self.pos_end,
-                    f"Error writing to CSV file: {e}",
+                    f"Array sizes do not match ({len(arr.value)} and {len(mask.value)})",
                     exec_ctx,
                 )
             )
+        return RTResult().success(
+            Array(array(arr.value.typecode, compress(arr.value, mask.value)))
+        )
 
 
 for method_name in [m for m in dir(BuiltInFunction) if m.startswith("execute_")]:
@@ -4882,22 +8589,23 @@ class Interpreter:
             List(value).set_context(context).set_pos(node.pos_start, node.pos_end)
         )
 
-    def visit_VarAccessNode(self, node, context: Context):
-        res = RTResult()
-        var_name = node.var_name_tok.value
-        value = None
-
+    def lookup_var(self, var_name, context: Context):
         if var_name in context.nonlocal_vars:
-            value = context.parent.symbol_table.get(var_name)
-        elif var_name in context.using_vars:
+            return context.parent.symbol_table.get(var_name)
+        if var_name in context.using_vars:
             global_st = context.symbol_table
             while global_st.parent:
                 global_st = global_st.parent
-            value = global_st.get(var_name)
-        else:
-            value = context.symbol_table.get(var_name)
-            if value is None:
-                value = context.private_symbol_table.get(var_name)
+            return global_st.get(var_name)
+        value = context.symbol_table.get(var_name)
+        if value is None:
+            value = context.private_symbol_table.get(var_name)
+        return value
+
+    def visit_VarAccessNode(self, node, context: Context):
+        res = RTResult()
+        var_name = node.var_name_tok.value
+        value = self.lookup_var(var_name, context)
 
         if value is None:
             return res.failure(
@@ -4909,7 +8617,10 @@ class Interpreter:
                 )
             )
 
-        if not isinstance(value, (NameSpace, List, HashMap)):
+        if isinstance(value, List | HashMap):
+            value.owned = False
+            copied_value = value
+        elif not isinstance(value, NameSpace | Set):
             copied_value = value.copy()
         else:
             copied_value = value
@@ -4944,35 +8655,97 @@ class Interpreter:
         value = res.register(self.visit(node.value_node, context))
         if res.should_return():
             return res
+        self.assign_var(var_name, value, context)
+        return res.success(value)
 
+    def binding_tables(self, var_name, context: Context):
         if var_name in context.using_vars:
-            global_symbol_table = context.symbol_table
-            while global_symbol_table.parent:
-                global_symbol_table = global_symbol_table.parent
-            global_symbol_table.set(var_name, value)
-
+            symbol_table = context.symbol_table
+            while symbol_table.parent:
+                symbol_table = symbol_table.parent
         elif var_name in context.nonlocal_vars:
-            context.parent.symbol_table.set(var_name, value)
+            symbol_table = context.parent.symbol_table
+        else:
+            symbol_table = context.symbol_table
+        return symbol_table, context.private_symbol_table
 
+    def assign_var(self, var_name, value, context: Context):
+        for symbol_table in self.binding_tables(var_name, context):
+            symbol_table.set(var_name, value)
+
+    def visit_AugAssignNode(self, node, context: Context):
+        res = RTResult()
+        op_node = node.value_node
+        var_name = node.var_name_tok.value
+        symbol_table, _ = self.binding_tables(var_name, context)
+        left = symbol_table.symbols.get(var_name)
+        if node.is_statement and isinstance(left, List | HashMap) and left.owned:
+            left.set_pos(op_node.left_node.pos_start, op_node.left_node.pos_end)
+            left.set_context(context)
         else:
-            context.symbol_table.set(var_name, value)
+            left = res.register(self.visit(op_node.left_node, context))
+            if res.should_return():
+                return res
+        right = res.register(self.visit(op_node.right_node, context))
+        if res.should_return():
+            return res
 
-        context.private_symbol_table.set(var_name, value)
+        # A list or map is owned while the statement-level `+=`/`*=` that
+        # produced it is its only user: reading the name anywhere else,
+        # including in `right`, clears the flag and the update copies.
+        op_type = op_node.op_tok.type
+        owned = isinstance(left, List | HashMap) and left.owned
+        if (
+            owned
+            and isinstance(left, List)
+            and (op_type == TT_PLUS or isinstance(right, List))
+        ):
+            if left.shared:
+                left.detach()
+            if op_type == TT_PLUS:
+                left.value.append(right)
+            else:
+                left.value.extend(right.value)
+            value = left
+        elif owned and op_type == TT_PLUS and isinstance(right, HashMap):
+            left.value.update(right.value)
+            value = left
+        elif (
+            op_type == TT_PLUS
+            and isinstance(left, StringBuilder)
+            and isinstance(right, String)
+        ):
+            left.append(right.value)
+            value = left
+        else:
+            value = res.register(self.binary_operation(op_node, left, right, context))
+            if res.should_return():
+                return res
 
+        if isinstance(left, List | HashMap) and isinstance(value, List | HashMap):
+            value.owned = node.is_statement
+        self.assign_var(var_name, value, context)
         return res.success(value)
 
     def initialize_namespace(self, namespace_obj):
         if namespace_obj.get("initialized_", checked=True).value:
             return
-        stmts = namespace_obj.get("statements_", checked=True)
-        ns_context = namespace_obj.get("context_", checked=True)
-        for stmt in stmts:
-            _ = self.visit(stmt, ns_context)
-        for k, v in ns_context.symbol_table.symbols.items():
-            namespace_obj.set(k, v)
-        for k, v in ns_context.private_symbol_table.symbols.items():
-            namespace_obj.set(k, v)
-        namespace_obj.set("initialized_", Number.true, checked=True)
+        with namespace_obj.get("init_lock_", checked=True):
+            if namespace_obj.get("initialized_", checked=True).value:
+                return
+            stmts = namespace_obj.get("statements_", checked=True)
+            ns_context = namespace_obj.get("context_", checked=True)
+            for stmt in stmts:
+                _ = self.visit(stmt, ns_context)
+            for k, v in ns_context.symbol_table.symbols.items():
+                if isinstance(v, List | HashMap):
+                    v.owned = False
+                namespace_obj.set(k, v)
+            for k, v in ns_context.private_symbol_table.symbols.items():
+                if isinstance(v, List | HashMap):
+                    v.owned = False
+                namespace_obj.set(k, v)
+            namespace_obj.set("initialized_", Number.true, checked=True)
 
     def visit_NameSpaceNode(self, node, context):
         res = RTResult()
@@ -5022,6 +8795,8 @@ class Interpreter:
             )
         if isinstance(member, Error):
             return res.failure(member)
+        if isinstance(member, List | HashMap):
+            member.owned = False
         return res.success(member)
 
     def visit_BinOpNode(self, node, context):
@@ -5059,17 +8834,24 @@ class Interpreter:
         right = res.register(self.visit(node.right_node, context))
         if res.should_return():
             return res
+        return self.binary_operation(node, left, right, context)
 
+    def binary_operation(self, node, left, right, context):
+        res = RTResult()
         op_type = node.op_tok.type
 
         if op_type == TT_COMMA:
             if isinstance(left, List):
+                if left.shared:
+                    left.detach()
                 if isinstance(right, List):
                     left.value.extend(right.value)
                 else:
                     left.value.append(right)
                 result = left
             elif isinstance(right, List):
+                if right.shared:
+                    right.detach()
                 right.value.insert(0, left)
                 result = right
             else:
@@ -5299,6 +9081,12 @@ class Interpreter:
             )
 
         for i in range(start, end, step):
+            if cancel_tokens_active:
+                reason = cancel_reason()
+                if reason:
+                    return res.failure(
+                        RTError(node.pos_start, node.pos_end, reason, context)
+                    )
             context.symbol_table.set(var_name, Number(i))
             value = res.register(self.visit(node.body_node, context))
 
@@ -5344,6 +9132,12 @@ class Interpreter:
             elements = []
 
         while True:
+            if cancel_tokens_active:
+                reason = cancel_reason()
+                if reason:
+                    return res.failure(
+                        RTError(node.pos_start, node.pos_end, reason, context)
+                    )
             condition = res.register(self.visit(condition_node, context))
             if res.should_return():
                 return res
@@ -5412,6 +9206,12 @@ class Interpreter:
     def visit_CallNode(self, node, context):
         try:
             res = RTResult()
+            if cancel_tokens_active:
+                reason = cancel_reason()
+                if reason:
+                    return res.failure(
+                        RTError(node.pos_start, node.pos_end, reason, context)
+                    )
             value_to_call = res.register(self.visit(node.node_to_call, context))
             if res.should_return():
                 return res
@@ -5518,21 +9318,16 @@ class Interpreter:
 
     def visit_LoadNode(self, node: LoadNode, context: Context):
         res = RTResult()
-        path = node.file_path
-        if not os.path.isfile(path):
-            tmp_path = os.path.join(LIBS_PATH, node.file_path)
-            if os.path.isfile(tmp_path):
-                path = os.path.join(LIBS_PATH, node.file_path)
-
-            else:
-                return res.failure(
-                    RTError(
-                        node.pos_start,
-                        node.pos_end,
-                        f"No module named '{tmp_path}'",
-                        context,
-                    )
+        path = resolve_module_path(node.file_path)
+        if path is None:
+            return res.failure(
+                RTError(
+                    node.pos_start,
+                    node.pos_end,
+                    f"No module named '{os.path.join(LIBS_PATH, node.file_path)}'",
+                    context,
                 )
+            )
         result, err = load_module(path, self)
         if err:
             if isinstance(err, Error):
@@ -5588,7 +9383,23 @@ class Interpreter:
         loop_var = var_names.copy()
         try:
             while True:
-                current = next(iterator)
+                if cancel_tokens_active:
+                    reason = cancel_reason()
+                    if reason:
+                        return res.failure(
+                            RTError(node.pos_start, node.pos_end, reason, context)
+                        )
+                try:
+                    current = next(iterator)
+                except IterError as e:
+                    return res.failure(
+                        RTError(
+                            node.iterable_node.pos_start,
+                            node.iterable_node.pos_end,
+                            e.message,
+                            context,
+                        )
+                    )
                 if len(var_names) == 1:
                     context.symbol_table.set(var_names[0], current)
                 else:
@@ -5737,6 +9548,8 @@ class Interpreter:
                 )
 
             idx = int(index_obj.value)
+            if collection_obj.shared:
+                collection_obj.detach()
             try:
                 collection_obj.value[idx] = value_to_set
             except IndexError:
@@ -5749,6 +9562,54 @@ class Interpreter:
                     )
                 )
 
+        elif isinstance(collection_obj, Array):
+            if not isinstance(index_obj, Number):
+                return res.failure(
+                    RTError(
+                        node.index_node.pos_start,
+                        node.index_node.pos_end,
+                        "Array index must be a number",
+                        context,
+                    )
+                )
+            if not isinstance(value_to_set, Number) or isinstance(
+                value_to_set, NoneObject
+            ):
+                return res.failure(
+                    TError(
+                        node.value_node.pos_start,
+                        node.value_node.pos_end,
+                        "Array elements must be numbers",
+                        context,
+                    )
+                )
+
+            idx = int(index_obj.value)
+            values = collection_obj.value
+            try:
+                if values.typecode == "q":
+                    values[idx] = int(value_to_set.value)
+                else:
+                    values[idx] = value_to_set.value
+            except IndexError:
+                return res.failure(
+                    RTError(
+                        node.index_node.pos_start,
+                        node.index_node.pos_end,
+                        f"Index {idx} is out of bounds for array of size {len(values)}",
+                        context,
+                    )
+                )
+            except OverflowError:
+                return res.failure(
+                    MError(
+                        node.value_node.pos_start,
+                        node.value_node.pos_end,
+                        "Integer is too large for an int array",
+                        context,
+                    )
+                )
+
         elif isinstance(collection_obj, HashMap):
             if not isinstance(index_obj, String):
                 return res.failure(
@@ -5768,7 +9629,7 @@ class Interpreter:
                 RTError(
                     node.obj_node.pos_start,
                     node.obj_node.pos_end,
-                    "Indexed assignment can only be performed on a list or hashmap",
+                    "Indexed assignment can only be performed on a list, hashmap or array",
                     context,
                 )
             )
@@ -5859,6 +9720,12 @@ global_symbol_table.set("neg_inf", Number(float("-inf")))
 global_symbol_table.set("channel_type", String("<channel>"))
 global_symbol_table.set("thread_pool_type", String("<thread-pool>"))
 global_symbol_table.set("future_type", String("<future>"))
+global_symbol_table.set("worker_type", String("<worker>"))
+global_symbol_table.set("iterator_type", String("<iterator>"))
+global_symbol_table.set("csv_writer_type", String("<csv-writer>"))
+global_symbol_table.set("array_type", String("<array>"))
+global_symbol_table.set("string_builder_type", String("<string-builder>"))
+global_symbol_table.set("set_type", String("<set>"))
 
 for func in BUILTIN_FUNCTIONS:
     global_symbol_table.set(func, getattr(BuiltInFunction, func))
@@ -66,6 +66,20 @@ class VarAssignNode:
         return f"VarAssignNode({self.var_name_tok.value} = {self.value_node})"
 
 
+class AugAssignNode:
+    __slots__ = ["var_name_tok", "value_node", "is_statement", "pos_start", "pos_end"]
+
+    def __init__(self, var_name_tok, value_node):
+        self.var_name_tok = var_name_tok
+        self.value_node = value_node
+        self.is_statement = False
+        self.pos_start = self.var_name_tok.pos_start
+        self.pos_end = self.value_node.pos_end
+
+    def __str__(self):
+        return f"AugAssignNode({self.var_name_tok.value} = {self.value_node})"
+
+
 class BinOpNode:
     __slots__ = ["left_node", "op_tok", "right_node", "pos_start", "pos_end"]
 
@@ -98,6 +98,8 @@ class Parser:
         statement = res.register(self.statement())
         if res.error:
             return res
+        if isinstance(statement, AugAssignNode):
+            statement.is_statement = True
         statements.append(statement)
 
         more_statements = True
@@ -122,6 +124,8 @@ class Parser:
                 more_statements = False
                 continue
 
+            if isinstance(statement, AugAssignNode):
+                statement.is_statement = True
             statements.append(statement)
 
         return res.success(
@@ -288,6 +292,14 @@ class Parser:
 
                     if is_multi_assign:
                         return res.success(MultiAssignNode(var_name_toks, rhs_node))
+                    elif (
+                        isinstance(rhs_node, BinOpNode)
+                        and rhs_node.op_tok.type in (TT_PLUS, TT_MUL)
+                        and isinstance(rhs_node.left_node, VarAccessNode)
+                        and rhs_node.left_node.var_name_tok.value
+                        == var_name_toks[0].value
+                    ):
+                        return res.success(AugAssignNode(var_name_toks[0], rhs_node))
                     else:
                         return res.success(VarAssignNode(var_name_toks[0], rhs_node))
 
@@ -105,7 +105,7 @@ class RTResult:
     def should_return(self):
         return (
             self.error
-            or self.func_return_value
+            or self.func_return_value is not None
             or self.loop_should_continue
             or self.loop_should_break
         )